@@ -2,9 +2,26 @@
 Backend API for the mutual fund FAQ assistant using RAG
 """
 
-import logging
 import os
+
+# Under gunicorn's gevent worker (GEVENT_PATCH is set by gunicorn.conf.py) patch the
+# stdlib before anything else is imported, so the sockets and threads created at
+# import or init time (Groq HTTP client, log listener) cooperate with the gevent hub
+if os.getenv("GEVENT_PATCH") == "1":
+    from gevent import monkey
+    monkey.patch_all()
+
+import atexit
+import enum
+import hashlib
+import hmac
+import logging
+import queue
+import shutil
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
 
 # Load environment variables from .env file
 try:
@@ -13,12 +30,34 @@ try:
 except ImportError:
     pass  # dotenv not installed, use system env vars
 
-# Setup logging first - before any imports that might fail
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler(sys.stdout)]
+# Setup logging first - before any imports that might fail.
+# Request threads only enqueue records; a background listener thread writes them
+# to stdout, so handlers never block on (or serialize behind) the stream lock.
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+_log_queue = queue.Queue(-1)
+_log_queue_handler = QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler])
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+def _restart_log_listener():
+    """Threads don't survive fork (gunicorn preload_app): start a fresh writer in the child"""
+    global _log_listener
+    atexit.unregister(_log_listener.stop)
+    # New queue too - the old one still lists the dead parent thread as a waiter
+    _log_queue_handler.queue = queue.Queue(-1)
+    _log_listener = QueueListener(_log_queue_handler.queue, *_log_listener.handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+
+os.register_at_fork(after_in_child=_restart_log_listener)
 logger = logging.getLogger(__name__)
 
 logger.info("="*70)
@@ -26,40 +65,141 @@ logger.info("Initializing backend_rag_api module...")
 logger.info("="*70)
 
 try:
-    from flask import Flask, request, jsonify
-    from flask_cors import CORS
-    logger.info("✓ Flask and CORS imported successfully")
+    from flask import Flask, Response, request, jsonify, stream_with_context
+    from werkzeug.exceptions import RequestEntityTooLarge
+    logger.info("✓ Flask imported successfully")
 except Exception as e:
     logger.error(f"✗ Failed to import Flask: {e}", exc_info=True)
     raise
 
 try:
-    from rag_pipeline import RAGPipeline
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False  # Fall back to Flask's stdlib json provider
+
+# Heavy modules (rag_pipeline pulls in sentence-transformers/torch, data_storage the
+# scraper stack) are imported on first use, so importing this module stays fast
+try:
     import config_rag
-    logger.info("✓ RAG pipeline modules imported successfully")
 except Exception as e:
-    logger.warning(f"⚠ Failed to import RAG modules: {e}")
-    logger.warning("⚠ App will start but RAG features won't work")
-    RAGPipeline = None
+    logger.warning(f"⚠ Failed to import config_rag: {e}")
     config_rag = None
 
 # Initialize Flask app
 app = Flask(__name__)
-CORS(app, resources={r"/*": {"origins": "*"}})  # Enable CORS for frontend integration
+# Bound request bodies before they are read into memory (queries are tiny)
+app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024
+
+# CORS for frontend integration: every route allows any origin. Flask answers
+# preflight OPTIONS requests itself; this hook just adds the headers.
+_CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Access-Control-Max-Age': '86400',  # let browsers cache the preflight result
+}
+
+
+@app.after_request
+def add_cors_headers(response):
+    response.headers.update(_CORS_HEADERS)
+    return response
+
+
+if ORJSON_AVAILABLE:
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson (C serializer) for jsonify and request.get_json"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+        def response(self, *args, **kwargs):
+            # orjson produces bytes - hand them to the response as-is (no str round trip)
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(
+                orjson.dumps(obj, default=self.default), mimetype=self.mimetype
+            )
+
+    app.json = OrjsonProvider(app)
+    logger.info("✓ Using orjson for JSON serialization")
+
+
+def _json_bytes(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes with the app's JSON settings"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=app.json.default)
+    return app.json.dumps(obj).encode('utf-8')
+
+# Shared fund data storage (constructed on first use, reused by every request)
+_storage = None
+
+
+def _get_storage():
+    """Return the shared DataStorage, importing data_storage on first call"""
+    global _storage
+    if _storage is None:
+        from data_storage import DataStorage
+        _storage = DataStorage()
+    return _storage
+
+# Answered queries, reused for repeated and paraphrased questions, and the
+# batcher embedding concurrent queries together (both owned by the pipeline)
+_response_cache = None
+_query_batcher = None
 
 # Initialize RAG pipeline (lazy initialization - will be created on first use)
+class _PipelineState(enum.Enum):
+    UNINIT = "uninit"
+    READY = "ready"
+    FAILED = "failed"
+
+
 rag_pipeline = None
 _rag_initialization_error = None
+_rag_state = _PipelineState.UNINIT
+
+# Mode information reported by /health, filled in once the pipeline is built
+_UNKNOWN_MODE_INFO = {
+    "embeddings": "unknown",
+    "llm": "unknown",
+    "fallback_active": False
+}
+_pipeline_mode_info = _UNKNOWN_MODE_INFO
+
+_rag_init_lock = threading.Lock()
 
 def get_rag_pipeline():
-    """Lazy initialization of RAG pipeline"""
-    global rag_pipeline, _rag_initialization_error
-    
-    if RAGPipeline is None:
-        logger.warning("RAGPipeline not available (import failed)")
-        return None
+    """Return the RAG pipeline (None if it failed), initializing it on first call"""
+    if _rag_state is _PipelineState.UNINIT:
+        _init_rag_pipeline()
+    return rag_pipeline
+
+
+def _init_rag_pipeline():
+    """Build the pipeline and its helpers (thread-safe, runs at most once)"""
+    global rag_pipeline, _rag_initialization_error, _rag_state, _response_cache, _query_batcher
+    global _pipeline_mode_info
     
-    if rag_pipeline is None and _rag_initialization_error is None:
+    with _rag_init_lock:
+        # Re-check: another request may have finished initialization while we waited
+        if _rag_state is not _PipelineState.UNINIT:
+            return
+        
+        try:
+            from rag_pipeline import RAGPipeline
+            logger.info("✓ RAG pipeline modules imported successfully")
+        except Exception as e:
+            logger.warning(f"⚠ Failed to import RAG modules: {e}")
+            logger.warning("⚠ App will keep running but RAG features won't work")
+            _rag_initialization_error = f"Import failed: {e}"
+            _rag_state = _PipelineState.FAILED
+            return
+        
         api_key = os.getenv("GROQ_API_KEY")
         if config_rag:
             api_key = api_key or getattr(config_rag, 'GROQ_API_KEY', None)
@@ -67,20 +207,56 @@ def get_rag_pipeline():
         if not api_key:
             logger.warning("No Groq API key found. RAG pipeline may not work correctly.")
             _rag_initialization_error = "No API key"
-            return None
+            _rag_state = _PipelineState.FAILED
+            return
         
         try:
             logger.info("Attempting to initialize RAG pipeline with Groq...")
             # Always use local embeddings (Groq doesn't provide embeddings)
-            rag_pipeline = RAGPipeline(api_key=api_key, use_local_embeddings=True)
+            # Groq calls go through the pipeline module's shared keep-alive HTTP client
+            pipeline = RAGPipeline(api_key=api_key, use_local_embeddings=True)
+            # The pipeline owns the response cache; /query also consults it before embedding
+            _response_cache = pipeline.response_cache
+            _query_batcher = pipeline.query_batcher
+            atexit.register(pipeline.save_response_cache)
+            # Embeddings are always local with Groq; Groq doesn't need a fallback
+            embedder_type = type(getattr(pipeline.embedder, 'embedder', pipeline.embedder)).__name__
+            _pipeline_mode_info = {
+                "embeddings": "local (sentence-transformers)" if "Local" in embedder_type else "gemini-api",
+                "llm": "groq-api" if hasattr(pipeline, 'groq_client') else "gemini-api",
+                "fallback_active": False
+            }
+            # Publish only once fully set up - the fast path reads these without the lock
+            rag_pipeline = pipeline
+            _rag_state = _PipelineState.READY
             logger.info("RAG pipeline initialized successfully with Groq LLM and local embeddings")
         except Exception as e:
             logger.error(f"Failed to initialize RAG pipeline: {e}", exc_info=True)
             _rag_initialization_error = str(e)
-            rag_pipeline = None
-    elif _rag_initialization_error:
-        return None
-    return rag_pipeline
+            _rag_state = _PipelineState.FAILED
+
+
+# Build the pipeline during worker/container init so the embedding model load and
+# vector store open are not paid by the first request. RAG_EAGER_INIT does it
+# synchronously (required before a fork, e.g. gunicorn preload_app); otherwise a
+# background thread warms it up while the server starts accepting requests.
+# Periodic GET /health pings (e.g. a cron every 5 minutes) then keep it warm.
+# Skipped when run as a script that execs gunicorn (see __main__ below), which would
+# discard the half-built pipeline - the gunicorn processes build their own.
+_EXEC_GUNICORN = (
+    __name__ == '__main__'
+    and os.getenv('FLASK_DEBUG', 'False').lower() != 'true'
+    and shutil.which('gunicorn') is not None
+)
+_prewarm_thread = None
+if _EXEC_GUNICORN:
+    logger.info("Starting gunicorn - the RAG pipeline is built by the gunicorn processes")
+elif os.getenv('RAG_EAGER_INIT', 'False').lower() == 'true':
+    logger.info("RAG_EAGER_INIT set, initializing RAG pipeline at import time...")
+    get_rag_pipeline()
+elif os.getenv('RAG_PREWARM', '1') == '1':
+    _prewarm_thread = threading.Thread(target=get_rag_pipeline, name="rag-prewarm", daemon=True)
+    _prewarm_thread.start()
 
 
 @app.route('/', methods=['GET'])
@@ -99,43 +275,37 @@ def root():
     }), 200
 
 
+# /health response bodies, serialized once per (rag_ready, rag_error) state
+_health_bodies = {}
+
+
+def _health_body(pipeline_ready: bool) -> bytes:
+    key = (pipeline_ready, _rag_initialization_error)
+    body = _health_bodies.get(key)
+    if body is None:
+        body = _json_bytes({
+            "status": "healthy",
+            "service": "Mutual Fund FAQ Assistant (RAG)",
+            "rag_ready": pipeline_ready,
+            "rag_error": _rag_initialization_error if _rag_initialization_error else None,
+            "mode": _pipeline_mode_info if pipeline_ready else _UNKNOWN_MODE_INFO,
+            "message": "Service is fully operational." if pipeline_ready else "Service is running. RAG pipeline may need data initialization."
+        })
+        _health_bodies[key] = body
+    return body
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint - must work even if RAG pipeline fails"""
     try:
-        pipeline = get_rag_pipeline()
-        global _rag_initialization_error
-        
-        # Get mode information
-        mode_info = {
-            "embeddings": "unknown",
-            "llm": "unknown",
-            "fallback_active": False
-        }
-        
-        if pipeline:
-            # Check embedding mode (always local with Groq)
-            embedder_type = type(pipeline.embedder).__name__
-            if "Local" in embedder_type:
-                mode_info["embeddings"] = "local (sentence-transformers)"
-            else:
-                mode_info["embeddings"] = "gemini-api"
-            
-            # Check LLM mode (Groq)
-            if hasattr(pipeline, 'groq_client'):
-                mode_info["llm"] = "groq-api"
-            else:
-                mode_info["llm"] = "gemini-api"
-            mode_info["fallback_active"] = False  # Groq doesn't need fallback
+        # Don't block on the init lock while the background warm-up is still running
+        if _prewarm_thread is not None and _prewarm_thread.is_alive():
+            pipeline = rag_pipeline
+        else:
+            pipeline = get_rag_pipeline()
         
-        return jsonify({
-            "status": "healthy",
-            "service": "Mutual Fund FAQ Assistant (RAG)",
-            "rag_ready": pipeline is not None,
-            "rag_error": _rag_initialization_error if _rag_initialization_error else None,
-            "mode": mode_info,
-            "message": "Service is running. RAG pipeline may need data initialization." if not pipeline else "Service is fully operational."
-        })
+        return _json_body_response(_health_body(pipeline is not None), 200)
     except Exception as e:
         # Health check should always succeed
         logger.error(f"Error in health check: {e}")
@@ -147,12 +317,25 @@ def health_check():
         }), 200
 
 
+# ChromaDB client for the status checks, opened once
+_chroma_client = None
+
+
+def _get_chroma_client():
+    """Return a shared ChromaDB client (the live pipeline's own client if it uses Chroma)"""
+    global _chroma_client
+    pipeline_client = getattr(getattr(rag_pipeline, 'vector_store', None), 'client', None)
+    if pipeline_client is not None:
+        return pipeline_client
+    if _chroma_client is None:
+        import chromadb
+        _chroma_client = chromadb.PersistentClient(path=config_rag.VECTOR_DB_PATH)
+    return _chroma_client
+
+
 @app.route('/debug/rag-status', methods=['GET'])
 def debug_rag_status():
     """Debug endpoint to check RAG pipeline initialization status"""
-    import os
-    import os.path as path
-    
     global rag_pipeline, _rag_initialization_error
     
     debug_info = {
@@ -160,25 +343,21 @@ def debug_rag_status():
         "initialization_error": _rag_initialization_error,
         "api_key_set": bool(os.getenv("GOOGLE_API_KEY")),
         "vector_db_path": config_rag.VECTOR_DB_PATH if config_rag else "N/A",
-        "vector_db_exists": path.exists(config_rag.VECTOR_DB_PATH) if config_rag else False,
-        "data_storage_exists": path.exists("data/storage/funds_database.json"),
+        "vector_db_exists": os.path.exists(config_rag.VECTOR_DB_PATH) if config_rag else False,
+        "data_storage_exists": os.path.exists("data/storage/funds_database.json"),
     }
     
     # Try to get more info
     try:
-        from data_storage import DataStorage
-        storage = DataStorage()
-        data = storage.load_data()
+        data = _get_storage().load_data()
         debug_info["funds_in_storage"] = len(data.get("funds", {})) if data else 0
     except Exception as e:
         debug_info["storage_error"] = str(e)
     
     # Check vector store
     try:
-        if path.exists(config_rag.VECTOR_DB_PATH):
-            import chromadb
-            client = chromadb.PersistentClient(path=config_rag.VECTOR_DB_PATH)
-            collections = client.list_collections()
+        if os.path.exists(config_rag.VECTOR_DB_PATH):
+            collections = _get_chroma_client().list_collections()
             debug_info["vector_db_collections"] = [c.name for c in collections]
             debug_info["vector_db_collection_count"] = len(collections)
         else:
@@ -190,6 +369,69 @@ def debug_rag_status():
     return jsonify(debug_info), 200
 
 
+def _error_body(message: str) -> bytes:
+    """Serialize a fixed {"success": false, "error": ...} body once"""
+    return _json_bytes({"success": False, "error": message})
+
+
+def _json_body_response(body: bytes, status: int) -> Response:
+    """Wrap pre-serialized JSON bytes in a fresh response"""
+    return Response(body, status=status, mimetype='application/json')
+
+
+# Pre-serialized bodies for the fixed /query error responses
+_PIPELINE_NOT_READY_BODY = _error_body(
+    "RAG pipeline not initialized. Please check logs and ensure data is initialized."
+)
+_MISSING_QUERY_BODY = _error_body("Missing 'query' in request body")
+_EMPTY_QUERY_BODY = _error_body("Query cannot be empty")
+_BODY_TOO_LARGE_BODY = _error_body("Request body too large")
+
+# Streamed answers are written in batches of this many LLM tokens, not one write per token
+_STREAM_TOKEN_BATCH = 16
+
+
+def _format_query_response(response: dict, query: str) -> dict:
+    """Shape a pipeline response for the frontend (answer_query always sets these keys)"""
+    return {
+        "success": response["success"],
+        "answer": response["answer"],
+        "source_urls": response["source_urls"],
+        "query": query,
+        "retrieved_chunks": response["retrieved_chunks"]
+    }
+
+
+def _ndjson_line(obj: dict) -> bytes:
+    return _json_bytes(obj) + b"\n"
+
+
+def _stream_query(pipeline, query, top_k, query_embedding):
+    """
+    Yield a streamed /query answer as newline-delimited JSON:
+    {"type": "token", "text": ...} lines, then one {"type": "done", ...} line
+    """
+    try:
+        batch = []
+        for event in pipeline.answer_query_stream(query, top_k=top_k, query_embedding=query_embedding):
+            if event["type"] == "token":
+                batch.append(event["text"])
+                if len(batch) >= _STREAM_TOKEN_BATCH:
+                    yield _ndjson_line({"type": "token", "text": "".join(batch)})
+                    batch = []
+                continue
+            
+            if batch:
+                yield _ndjson_line({"type": "token", "text": "".join(batch)})
+                batch = []
+            response = {k: v for k, v in event.items() if k != "type"}
+            yield _ndjson_line({"type": "done", **_format_query_response(response, query)})
+    except Exception as e:
+        # Headers are already sent, so report the error in-band
+        logger.error("Error streaming query: %s", e, exc_info=True)
+        yield _ndjson_line({"type": "error", "success": False, "error": str(e)})
+
+
 @app.route('/query', methods=['POST'])
 def handle_query():
     """
@@ -197,7 +439,9 @@ def handle_query():
     
     Request body:
     {
-        "query": "What is the exit load for Parag Parikh ELSS Tax Saver Fund?"
+        "query": "What is the exit load for Parag Parikh ELSS Tax Saver Fund?",
+        "top_k": 3,  (optional, number of chunks to retrieve)
+        "stream": true  (optional, stream the answer as application/x-ndjson)
     }
     
     Response:
@@ -211,76 +455,132 @@ def handle_query():
     """
     pipeline = get_rag_pipeline()
     if not pipeline:
-        return jsonify({
-            "success": False,
-            "error": "RAG pipeline not initialized. Please check logs and ensure data is initialized."
-        }), 500
+        return _json_body_response(_PIPELINE_NOT_READY_BODY, 500)
     
     try:
         data = request.get_json()
         
         if not data or 'query' not in data:
-            return jsonify({
-                "success": False,
-                "error": "Missing 'query' in request body"
-            }), 400
+            return _json_body_response(_MISSING_QUERY_BODY, 400)
         
         query = data['query'].strip()
         
         if not query:
+            return _json_body_response(_EMPTY_QUERY_BODY, 400)
+        
+        top_k = data.get('top_k')
+        if top_k is not None and (
+            not isinstance(top_k, int) or isinstance(top_k, bool)
+            or not 1 <= top_k <= config_rag.MAX_TOP_K_RETRIEVAL
+        ):
             return jsonify({
                 "success": False,
-                "error": "Query cannot be empty"
+                "error": f"'top_k' must be an integer between 1 and {config_rag.MAX_TOP_K_RETRIEVAL}"
             }), 400
         
-        logger.info(f"Received query: {query} (Request ID: {id(query)})")
+        logger.info("Received query: %s (Request ID: %s)", query, id(query))
         
-        # Process query using RAG
-        logger.info(f"Starting RAG pipeline processing for query: {query[:50]}...")
-        response = pipeline.answer_query(query)
-        logger.info(f"Completed RAG pipeline processing for query: {query[:50]}...")
+        # Exact cache hits skip embedding altogether; paraphrase (semantic) hits are
+        # served by the pipeline once the query is embedded.
+        # A custom top_k changes the answer, so those requests bypass the cache.
+        use_cache = _response_cache is not None and top_k is None
+        response = _response_cache.get_exact(query) if use_cache else None
+        query_embedding = None
+        if response is None:
+            # Concurrent queries share one batched embedding call
+            query_embedding = _query_batcher.embed(query)
         
-        # Format response for frontend
-        formatted_response = {
-            "success": response.get("success", False),
-            "answer": response.get("answer", ""),
-            "source_urls": response.get("source_urls", []),
-            "query": query,
-            "retrieved_chunks": response.get("retrieved_chunks", 0)
-        }
+        stream = data.get('stream') is True
+        if response is not None:
+            logger.info("Serving cached response for query: %.50s...", query)
+            if stream:
+                return Response(
+                    _ndjson_line({"type": "done", **_format_query_response(response, query)}),
+                    mimetype='application/x-ndjson'
+                )
+        elif stream:
+            logger.info("Streaming RAG pipeline response for query: %.50s...", query)
+            return Response(
+                stream_with_context(_stream_query(pipeline, query, top_k, query_embedding)),
+                mimetype='application/x-ndjson'
+            )
+        else:
+            # Process query using RAG
+            logger.info("Starting RAG pipeline processing for query: %.50s...", query)
+            # answer_query stores successful default-top_k answers in the cache
+            response = pipeline.answer_query(query, top_k=top_k, query_embedding=query_embedding)
+            logger.info("Completed RAG pipeline processing for query: %.50s...", query)
         
-        return jsonify(formatted_response), 200
+        # Format response for frontend
+        return jsonify(_format_query_response(response, query)), 200
         
+    except RequestEntityTooLarge:
+        return _json_body_response(_BODY_TOO_LARGE_BODY, 413)
     except Exception as e:
-        logger.error(f"Error processing query: {e}", exc_info=True)
+        logger.error("Error processing query: %s", e, exc_info=True)
         return jsonify({
             "success": False,
             "error": str(e)
         }), 500
 
 
+def _is_admin_request() -> bool:
+    """True if the request carries ADMIN_TOKEN as a bearer token (never if it is unset)"""
+    admin_token = os.getenv("ADMIN_TOKEN")
+    if not admin_token:
+        return False
+    auth = request.headers.get('Authorization', '')
+    return auth.startswith('Bearer ') and hmac.compare_digest(auth[7:].encode(), admin_token.encode())
+
+
+@app.route('/admin/cache/clear', methods=['POST'])
+def clear_response_cache():
+    """Drop all cached /query responses (e.g. after re-initializing data); requires ADMIN_TOKEN"""
+    if not _is_admin_request():
+        return jsonify({"success": False, "error": "Forbidden"}), 403
+    if _response_cache is not None:
+        _response_cache.clear()
+    logger.info("Response cache cleared")
+    return jsonify({"success": True, "message": "Response cache cleared"}), 200
+
+
+# Fields exposed by /funds; DataStorage always writes both keys for stored funds
+_FUND_LIST_KEYS = ("fund_name", "source_url")
+_project_fund = itemgetter(*_FUND_LIST_KEYS)
+
+# Serialized /funds response, rebuilt only when the funds database file changes
+_funds_cache = {"mtime": None, "etag": None, "body": None}
+
+
 @app.route('/funds', methods=['GET'])
 def list_funds():
-    """List all available funds"""
+    """List all available funds (cached per data file version, supports ETag/304)"""
     try:
-        from data_storage import DataStorage
-        storage = DataStorage()
-        funds_data = storage.load_data()
-        funds = funds_data.get("funds", {})
+        mtime = os.stat(_get_storage().funds_file).st_mtime_ns
         
-        fund_list = [
-            {
-                "fund_name": fund_data.get("fund_name"),
-                "source_url": fund_data.get("source_url")
-            }
-            for fund_data in funds.values()
-        ]
+        if _funds_cache["mtime"] != mtime:
+            funds_data = _get_storage().load_data()
+            funds = funds_data.get("funds", {})
+            
+            fund_list = [
+                dict(zip(_FUND_LIST_KEYS, _project_fund(fund_data)))
+                for fund_data in funds.values()
+            ]
+            
+            body = _json_bytes({
+                "success": True,
+                "count": len(fund_list),
+                "funds": fund_list
+            })
+            _funds_cache.update(
+                mtime=mtime,
+                etag=hashlib.blake2b(body, digest_size=8).hexdigest(),
+                body=body
+            )
         
-        return jsonify({
-            "success": True,
-            "count": len(fund_list),
-            "funds": fund_list
-        }), 200
+        response = Response(_funds_cache["body"], mimetype='application/json')
+        response.set_etag(_funds_cache["etag"])
+        return response.make_conditional(request)
     except Exception as e:
         logger.error(f"Error listing funds: {e}")
         return jsonify({
@@ -289,34 +589,51 @@ def list_funds():
         }), 500
 
 
+# /init runs the scraper and index build in-process, in the request thread. One
+# initialization at a time: a concurrent /init is rejected instead of queueing behind it.
+_init_lock = threading.Lock()
+
+
+def _build_index():
+    """Rebuild the vector index, reusing the live pipeline (and its loaded model) if any"""
+    from build_rag_index import run as build_index
+    # build_index also drops the pipeline's cached answers
+    return build_index(get_rag_pipeline())
+
+
 @app.route('/init', methods=['POST'])
 def initialize_data():
     """
     Initialize data - call this once after deployment.
     This allows data initialization without shell access.
     """
-    import subprocess
-    import sys
-    import os
-    
     logger.info("Data initialization requested")
     
+    if not _init_lock.acquire(blocking=False):
+        logger.warning("Data initialization already in progress, rejecting request")
+        return jsonify({
+            "success": False,
+            "error": "Initialization already in progress (takes 5-10 minutes)"
+        }), 409
+    try:
+        return _initialize_data()
+    finally:
+        _init_lock.release()
+
+
+def _initialize_data():
+    """Scrape (unless fund data exists) and build the index; called with _init_lock held"""
     try:
         # Check if data already exists
-        from data_storage import DataStorage
-        import os.path as path
-        storage = DataStorage()
-        existing_data = storage.load_data()
+        existing_data = _get_storage().load_data()
         
         # Check if vector DB exists
-        vector_db_exists = path.exists(config_rag.VECTOR_DB_PATH) if config_rag else False
+        vector_db_exists = os.path.exists(config_rag.VECTOR_DB_PATH) if config_rag else False
         
         if existing_data and existing_data.get("funds") and vector_db_exists:
             # Check if vector DB has data
             try:
-                import chromadb
-                client = chromadb.PersistentClient(path=config_rag.VECTOR_DB_PATH)
-                collections = client.list_collections()
+                collections = _get_chroma_client().list_collections()
                 if collections:
                     logger.info("Data and vector DB already exist, skipping initialization")
                     return jsonify({
@@ -332,20 +649,14 @@ def initialize_data():
         if existing_data and existing_data.get("funds"):
             logger.info("Data exists but vector DB missing, rebuilding index only...")
             # Skip scraper, just build index
-            result2 = subprocess.run(
-                [sys.executable, 'build_rag_index.py'], 
-                capture_output=True, 
-                text=True, 
-                timeout=600,
-                cwd=os.getcwd()
-            )
-            
-            if result2.returncode != 0:
-                logger.error(f"Index builder failed: {result2.stderr}")
+            try:
+                index_result = _build_index()
+            except Exception as e:
+                logger.error(f"Index builder failed: {e}", exc_info=True)
                 return jsonify({
                     "success": False,
                     "error": "Index builder failed",
-                    "details": result2.stderr[-500:] if result2.stderr else "Unknown error"
+                    "details": str(e)[-500:]
                 }), 500
             
             logger.info("Index rebuilt successfully")
@@ -353,59 +664,42 @@ def initialize_data():
                 "success": True,
                 "message": "Vector index rebuilt successfully",
                 "funds_count": len(existing_data.get("funds", {})),
-                "index_output": result2.stdout[-200:] if result2.stdout else "No output"
+                "chunk_count": index_result["chunk_count"]
             }), 200
         
         # Run scraper
         logger.info("Running scraper...")
-        result1 = subprocess.run(
-            [sys.executable, 'main.py'], 
-            capture_output=True, 
-            text=True, 
-            timeout=600,  # 10 minute timeout
-            cwd=os.getcwd()
-        )
-        
-        if result1.returncode != 0:
-            logger.error(f"Scraper failed: {result1.stderr}")
+        try:
+            from main import run as run_scraper
+            scrape_result = run_scraper()
+        except Exception as e:
+            logger.error(f"Scraper failed: {e}", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": "Scraper failed",
-                "details": result1.stderr[-500:] if result1.stderr else "Unknown error"
+                "details": str(e)[-500:]
             }), 500
         
         # Run index builder
         logger.info("Building RAG index...")
-        result2 = subprocess.run(
-            [sys.executable, 'build_rag_index.py'], 
-            capture_output=True, 
-            text=True, 
-            timeout=600,  # 10 minute timeout
-            cwd=os.getcwd()
-        )
-        
-        if result2.returncode != 0:
-            logger.error(f"Index builder failed: {result2.stderr}")
+        try:
+            index_result = _build_index()
+        except Exception as e:
+            logger.error(f"Index builder failed: {e}", exc_info=True)
             return jsonify({
                 "success": False,
                 "error": "Index builder failed",
-                "details": result2.stderr[-500:] if result2.stderr else "Unknown error"
+                "details": str(e)[-500:]
             }), 500
         
         logger.info("Data initialization completed successfully")
         return jsonify({
             "success": True,
             "message": "Data initialized successfully",
-            "scraper_output": result1.stdout[-200:] if result1.stdout else "No output",
-            "index_output": result2.stdout[-200:] if result2.stdout else "No output"
+            "funds_scraped": scrape_result["funds_scraped"],
+            "chunk_count": index_result["chunk_count"]
         }), 200
         
-    except subprocess.TimeoutExpired:
-        logger.error("Initialization timed out")
-        return jsonify({
-            "success": False,
-            "error": "Initialization timed out (takes 5-10 minutes)"
-        }), 500
     except Exception as e:
         logger.error(f"Initialization error: {e}", exc_info=True)
         return jsonify({
@@ -414,7 +708,7 @@ def initialize_data():
         }), 500
 
 
-# For local development only
+# Entry point: gunicorn (see gunicorn.conf.py) unless FLASK_DEBUG is set or gunicorn is missing
 if __name__ == '__main__':
     # Use port 5001 by default (5000 is often used by AirPlay on macOS)
     port = int(os.getenv('PORT', 5001))
@@ -430,5 +724,16 @@ if __name__ == '__main__':
     print("  GET  /health - Health check")
     print("\n" + "="*70 + "\n")
     
+    if _EXEC_GUNICORN:
+        # Preforked workers; replaces this process
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        os.execvp('gunicorn', [
+            'gunicorn',
+            '--chdir', base_dir,
+            '-c', os.path.join(base_dir, 'gunicorn.conf.py'),
+            'backend_rag_api:app'
+        ])
+    
+    # Local development: Flask's built-in server
     app.run(debug=debug_mode, host='0.0.0.0', port=port)
 
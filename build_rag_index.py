@@ -8,6 +8,28 @@ import sys
 from rag_pipeline import RAGPipeline
 import config_rag
 
+
+def run(pipeline=None) -> dict:
+    """
+    Build the RAG index in-process (used by the backend /init endpoint).
+    
+    Args:
+        pipeline: Existing RAGPipeline to reuse, so the embedding model is not loaded again
+        
+    Returns:
+        Status dictionary with the number of chunks indexed
+    """
+    if pipeline is None:
+        pipeline = RAGPipeline(use_local_embeddings=True)
+    
+    chunk_count = pipeline.build_index()
+    return {
+        "success": True,
+        "chunk_count": chunk_count,
+        "vector_db_path": config_rag.VECTOR_DB_PATH
+    }
+
+
 def main():
     """Build the RAG index"""
     print("="*70)
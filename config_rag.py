@@ -20,17 +20,63 @@ GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", "")
 GEMINI_EMBEDDING_MODEL = "models/embedding-001"  # Not used with Groq
 GEMINI_LLM_MODEL = "models/gemini-2.0-flash"  # Not used with Groq
 
+# Local embedding model (sentence-transformers). Either a model name or a path to a
+# model directory bundled with the deployment; a local path is loaded straight from
+# disk with no Hugging Face Hub download/check on cold start.
+LOCAL_EMBEDDING_MODEL = os.getenv("LOCAL_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+# Inference backend for the local model: "torch" (default) or "onnx" (ONNX Runtime,
+# needs sentence-transformers>=3.2 and: pip install "sentence-transformers[onnx]").
+# LOCAL_EMBEDDING_ONNX_FILE picks a file from the model's onnx/ folder, e.g. the int8
+# "onnx/model_qint8_avx512_vnni.onnx"; empty uses the default fp32 export.
+LOCAL_EMBEDDING_BACKEND = os.getenv("LOCAL_EMBEDDING_BACKEND", "torch")
+LOCAL_EMBEDDING_ONNX_FILE = os.getenv("LOCAL_EMBEDDING_ONNX_FILE", "")
+
 # Vector Database Configuration
 VECTOR_DB_TYPE = "chroma"  # Options: "chroma", "faiss", "memory"
 # Use /tmp for Vercel, data/vector_db for local development
 VECTOR_DB_PATH = os.getenv("VECTOR_DB_PATH", "data/vector_db")
+# In-memory embedding format of the simple vector store: "float32", "float16" or "int8"
+# (float16 is 2x smaller, int8 4x smaller; scores are within ~1% of float32)
+VECTOR_STORE_PRECISION = os.getenv("VECTOR_STORE_PRECISION", "float32")
+# Search backend of the simple vector store: "numpy" (matrix product) or "faiss"
+# (needs: pip install faiss-cpu; falls back to numpy when it is not installed)
+VECTOR_STORE_BACKEND = os.getenv("VECTOR_STORE_BACKEND", "numpy")
+# FAISS index type: "flat" (exact), "hnsw" (approximate, >95% recall) or "ivfpq"
+# (product-quantized, ~16x less index memory at a small recall cost). Approximate
+# indexes are only built once the collection exceeds ANN_MIN_VECTORS - a flat scan is
+# faster below that, and IVF-PQ needs enough vectors to train its codebooks
+ANN_BACKEND = os.getenv("ANN_BACKEND", "flat")
+ANN_MIN_VECTORS = 5000
+
+# Persistent embedding cache (SQLite file keyed by text hash + model); empty string disables it
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", "data/embed_cache/embeddings.sqlite3")
 
 # RAG Configuration
 CHUNK_SIZE = 500  # Characters per chunk
 CHUNK_OVERLAP = 50  # Overlap between chunks
 TOP_K_RETRIEVAL = 3  # Number of chunks to retrieve for context
+MAX_TOP_K_RETRIEVAL = 10  # Upper bound for a per-request "top_k" override
+# Approximate token budget for the retrieved context in the LLM prompt; lower-ranked
+# chunks beyond it are dropped (LLM latency and cost grow with input tokens)
+MAX_CONTEXT_TOKENS = 1000
+
+# Query embedding micro-batching: concurrent queries arriving within the wait window
+# are embedded with one model call (up to QUERY_BATCH_SIZE queries)
+QUERY_BATCH_SIZE = 32
+QUERY_BATCH_WAIT_SECONDS = 0.015
+
+# Response cache (/query): exact normalized-query hits, then semantic hits above the threshold
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_SIMILARITY = 0.95
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "3600"))
+# JSON file the response cache is saved to at shutdown (merged with the other workers'
+# entries) and reloaded from at startup; empty string keeps it in memory only
+RESPONSE_CACHE_PATH = os.getenv("RESPONSE_CACHE_PATH", "data/query_cache/responses.json")
 
 # Answer Generation
 MAX_TOKENS = 500
 TEMPERATURE = 0.0  # Low temperature for factual answers
+# Answer single-field lookups (expense ratio, exit load, ...) of one named fund directly
+# from the retrieved chunks instead of calling the LLM
+EXTRACTIVE_ANSWERS = os.getenv("EXTRACTIVE_ANSWERS", "true").lower() == "true"
 
@@ -3,11 +3,33 @@ Data chunking module for RAG system
 Converts structured fund data into text chunks for embedding
 """
 
-from typing import List, Dict
+import functools
+from typing import Dict, Iterator, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Keyword in a (lowercased) fund name -> name variations added to its chunks
+_VARIATION_TABLE = (
+    ('elss', ('ELSS', 'ELSS Tax Saver', 'ELSS Tax Saver Fund')),
+    ('arbitrage', ('Arbitrage', 'Arbitrage Fund')),
+    ('liquid', ('Liquid', 'Liquid Fund')),
+    ('conservative hybrid', ('Conservative Hybrid', 'Conservative Hybrid Fund')),
+    ('dynamic asset allocation', ('Dynamic Asset Allocation', 'Dynamic Asset Allocation Fund')),
+    ('long term value', ('Long Term Value', 'Long Term Value Fund')),
+    ('flexi cap', ('Flexi Cap', 'Flexi Cap Fund')),
+)
+
+# (label, field) of the single-field chunks created for each fund
+_FIELD_CHUNK_SPECS = (
+    ("Expense Ratio", "expense_ratio"),
+    ("Exit Load", "exit_load"),
+    ("Minimum SIP", "minimum_sip"),
+    ("Lock-in Period", "lock_in"),
+    ("Riskometer (Risk Factor)", "riskometer"),
+    ("Benchmark", "benchmark"),
+)
+
 
 class FundDataChunker:
     """Chunks mutual fund data into text for RAG"""
@@ -16,45 +38,26 @@ class FundDataChunker:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
     
-    def _get_fund_name_variations(self, fund_name: str) -> List[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_fund_name_variations(fund_name: str) -> Tuple[str, ...]:
         """Extract variations of fund name for better search matching"""
-        variations = []
         fund_lower = fund_name.lower()
         
         # Extract key terms
-        if 'elss' in fund_lower:
-            variations.append('ELSS')
-            variations.append('ELSS Tax Saver')
-            variations.append('ELSS Tax Saver Fund')
-        if 'arbitrage' in fund_lower:
-            variations.append('Arbitrage')
-            variations.append('Arbitrage Fund')
-        if 'liquid' in fund_lower:
-            variations.append('Liquid')
-            variations.append('Liquid Fund')
-        if 'conservative hybrid' in fund_lower:
-            variations.append('Conservative Hybrid')
-            variations.append('Conservative Hybrid Fund')
-        if 'dynamic asset allocation' in fund_lower:
-            variations.append('Dynamic Asset Allocation')
-            variations.append('Dynamic Asset Allocation Fund')
-        if 'long term value' in fund_lower:
-            variations.append('Long Term Value')
-            variations.append('Long Term Value Fund')
-        if 'flexi cap' in fund_lower:
-            variations.append('Flexi Cap')
-            variations.append('Flexi Cap Fund')
+        variations = [
+            variation
+            for keyword, keyword_variations in _VARIATION_TABLE
+            if keyword in fund_lower
+            for variation in keyword_variations
+        ]
         
         # Add Parag Parikh prefix variations
         if 'parag parikh' in fund_lower:
-            variations.append('Parag Parikh')
-            # Create a copy to avoid modifying list while iterating
-            existing_vars = variations[:]
-            for var in existing_vars:
-                if var and 'parag parikh' not in var.lower():
-                    variations.append(f'Parag Parikh {var}')
-        
-        return list(set(variations))  # Remove duplicates
+            variations += ['Parag Parikh'] + [f'Parag Parikh {var}' for var in variations]
+        
+        # Remove duplicates, keeping a stable order (chunk text must not vary between runs)
+        return tuple(dict.fromkeys(variations))
     
     def create_chunks_from_fund(self, fund_data: Dict) -> List[Dict]:
         """
@@ -109,70 +112,41 @@ class FundDataChunker:
             }
         })
         
-        # Individual field chunks for specific queries (also include variations)
-        field_variations_text = f"Also known as: {', '.join(fund_variations)}" if fund_variations else ""
+        # Individual field chunks for specific queries. The name variations live only in
+        # the comprehensive chunk - they are mostly substrings of the fund name, and
+        # repeating them made each short field chunk several times longer to embed.
+        field_prefix = f"Fund: {fund_name}\n"
+        base_meta = {"fund_name": fund_name, "source_url": source_url, "chunk_type": "field"}
         
         field_chunks = [
             {
-                "text": f"Fund: {fund_name}\n{field_variations_text}\nExpense Ratio: {fund_data.get('expense_ratio', 'N/A')}" if field_variations_text else f"Fund: {fund_name}\nExpense Ratio: {fund_data.get('expense_ratio', 'N/A')}",
-                "metadata": {
-                    "fund_name": fund_name,
-                    "source_url": source_url,
-                    "chunk_type": "field",
-                    "field": "expense_ratio"
-                }
-            },
-            {
-                "text": f"Fund: {fund_name}\n{field_variations_text}\nExit Load: {fund_data.get('exit_load', 'N/A')}" if field_variations_text else f"Fund: {fund_name}\nExit Load: {fund_data.get('exit_load', 'N/A')}",
-                "metadata": {
-                    "fund_name": fund_name,
-                    "source_url": source_url,
-                    "chunk_type": "field",
-                    "field": "exit_load"
-                }
-            },
-            {
-                "text": f"Fund: {fund_name}\n{field_variations_text}\nMinimum SIP: {fund_data.get('minimum_sip', 'N/A')}" if field_variations_text else f"Fund: {fund_name}\nMinimum SIP: {fund_data.get('minimum_sip', 'N/A')}",
-                "metadata": {
-                    "fund_name": fund_name,
-                    "source_url": source_url,
-                    "chunk_type": "field",
-                    "field": "minimum_sip"
-                }
-            },
-            {
-                "text": f"Fund: {fund_name}\n{field_variations_text}\nLock-in Period: {fund_data.get('lock_in', 'N/A')}" if field_variations_text else f"Fund: {fund_name}\nLock-in Period: {fund_data.get('lock_in', 'N/A')}",
-                "metadata": {
-                    "fund_name": fund_name,
-                    "source_url": source_url,
-                    "chunk_type": "field",
-                    "field": "lock_in"
-                }
-            },
-            {
-                "text": f"Fund: {fund_name}\n{field_variations_text}\nRiskometer (Risk Factor): {fund_data.get('riskometer', 'N/A')}" if field_variations_text else f"Fund: {fund_name}\nRiskometer (Risk Factor): {fund_data.get('riskometer', 'N/A')}",
-                "metadata": {
-                    "fund_name": fund_name,
-                    "source_url": source_url,
-                    "chunk_type": "field",
-                    "field": "riskometer"
-                }
-            },
-            {
-                "text": f"Fund: {fund_name}\n{field_variations_text}\nBenchmark: {fund_data.get('benchmark', 'N/A')}" if field_variations_text else f"Fund: {fund_name}\nBenchmark: {fund_data.get('benchmark', 'N/A')}",
-                "metadata": {
-                    "fund_name": fund_name,
-                    "source_url": source_url,
-                    "chunk_type": "field",
-                    "field": "benchmark"
-                }
+                "text": f"{field_prefix}{label}: {fund_data.get(field, 'N/A')}",
+                "metadata": {**base_meta, "field": field}
             }
+            for label, field in _FIELD_CHUNK_SPECS
         ]
         
         chunks.extend(field_chunks)
         
         return chunks
     
+    def iter_chunks_from_all_funds(self, funds_data: Dict) -> Iterator[Dict]:
+        """
+        Yield chunks fund by fund, so consumers can embed them in batches
+        without first materializing every chunk.
+        
+        Args:
+            funds_data: Dictionary with 'funds' key containing fund data
+        """
+        total = 0
+        for fund_name, fund_data in funds_data.get("funds", {}).items():
+            chunks = self.create_chunks_from_fund(fund_data)
+            total += len(chunks)
+            logger.info(f"Created {len(chunks)} chunks for {fund_name}")
+            yield from chunks
+        
+        logger.info(f"Total chunks created: {total}")
+    
     def create_chunks_from_all_funds(self, funds_data: Dict) -> List[Dict]:
         """
         Create chunks from all funds in the database.
@@ -183,13 +157,4 @@ class FundDataChunker:
         Returns:
             List of all chunks with metadata
         """
-        all_chunks = []
-        funds = funds_data.get("funds", {})
-        
-        for fund_name, fund_data in funds.items():
-            chunks = self.create_chunks_from_fund(fund_data)
-            all_chunks.extend(chunks)
-            logger.info(f"Created {len(chunks)} chunks for {fund_name}")
-        
-        logger.info(f"Total chunks created: {len(all_chunks)}")
-        return all_chunks
+        return list(self.iter_chunks_from_all_funds(funds_data))
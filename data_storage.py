@@ -5,6 +5,7 @@ Follows the recommended architecture: precompute and store with source URLs
 
 import json
 import os
+import re
 from datetime import datetime
 from typing import Dict, List, Optional
 import logging
@@ -18,9 +19,33 @@ except ImportError:
     SCRAPER_AVAILABLE = False
     # Scraper not needed in API functions
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False  # Fall back to stdlib json
+
 logger = logging.getLogger(__name__)
 
 
+def _normalize_name(name: str) -> str:
+    """Remove extra spaces, convert to lowercase"""
+    return ' '.join(name.lower().split())
+
+
+# The words between "Parag Parikh" and "Direct Growth" name the fund type
+_FUND_TYPE_RE = re.compile(r'parag parikh(.*?)direct growth', re.IGNORECASE)
+
+
+def _extract_fund_type(name: str) -> Optional[str]:
+    """Extract the words between "Parag Parikh" and "Direct Growth" (e.g. "liquid")"""
+    match = _FUND_TYPE_RE.search(name)
+    if match is None:
+        return None
+    # Remove "fund" if present
+    return match.group(1).lower().replace('fund', '').strip()
+
+
 class DataStorage:
     """Handles storage and retrieval of mutual fund data"""
     
@@ -28,6 +53,10 @@ class DataStorage:
         self.storage_dir = storage_dir
         self.funds_file = os.path.join(storage_dir, "funds_database.json")
         self.ensure_storage_directory()
+        
+        # Parsed funds file, reused until the file changes on disk
+        self._cache: Optional[Dict] = None
+        self._cache_key = None
     
     def ensure_storage_directory(self):
         """Create storage directory if it doesn't exist"""
@@ -134,19 +163,65 @@ class DataStorage:
             # If it's a dict but missing "funds" key, wrap it
             data = {"funds": data, "metadata": data.get("metadata", {})}
         
-        with open(self.funds_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            with open(self.funds_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(self.funds_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         logger.info(f"Data saved to {self.funds_file}")
+        self._set_cache(data)
+    
+    def _file_key(self):
+        """(mtime, size) of the funds file - changes whenever the file is rewritten"""
+        stat = os.stat(self.funds_file)
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _set_cache(self, data: Dict, file_key=None):
+        self._cache = data
+        self._cache_key = file_key or self._file_key()
+        self._build_name_index(data.get("funds", {}))
+    
+    def _build_name_index(self, funds: Dict):
+        """Precompute the lookup keys get_fund_by_name needs, once per loaded file"""
+        self._fund_names = tuple(funds)
+        self._by_normalized_name = {}
+        self._fund_types = []  # (fund type, fund data) in storage order
+        self._by_fund_type = {}  # fund type -> first fund with that type
+        # Name words as bitmaps: each distinct word gets one bit, each fund the OR of its words
+        self._word_bits = {}  # name word -> bit
+        self._word_masks = []  # per fund, in storage order
+        for stored_name, fund_data in funds.items():
+            self._by_normalized_name.setdefault(_normalize_name(stored_name), fund_data)
+            fund_type = _extract_fund_type(stored_name)
+            self._fund_types.append((fund_type, fund_data))
+            if fund_type:
+                self._by_fund_type.setdefault(fund_type, fund_data)
+            mask = 0
+            for word in stored_name.lower().split():
+                mask |= self._word_bits.setdefault(word, 1 << len(self._word_bits))
+            self._word_masks.append(mask)
     
     def load_data(self) -> Optional[Dict]:
-        """Load data from storage - normalizes to consistent dict format"""
-        if not os.path.exists(self.funds_file):
+        """
+        Load data from storage - normalizes to consistent dict format.
+        The parsed file is cached until it changes on disk. Callers get a new top-level
+        dict (replace or add its keys freely), but the nested "funds", "metadata" and
+        fund dicts are the cached objects: do not mutate them - copy.deepcopy first, and
+        write changes with save_data.
+        """
+        try:
+            file_key = self._file_key()
+        except FileNotFoundError:
             logger.warning(f"Storage file not found: {self.funds_file}")
             return None
         
+        if self._cache is not None and file_key == self._cache_key:
+            return dict(self._cache)
+        
         try:
-            with open(self.funds_file, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
+            with open(self.funds_file, 'rb') as f:
+                raw_data = orjson.loads(f.read()) if ORJSON_AVAILABLE else json.loads(f.read())
             
             # Normalize to dict format with "funds" key
             if isinstance(raw_data, list):
@@ -174,7 +249,7 @@ class DataStorage:
                 data["metadata"]["valid_funds"] = valid_count
                 data["metadata"]["invalid_funds"] = invalid_count
                 
-                # Save normalized format back
+                # Save normalized format back (once - later loads read the normalized file)
                 self.save_data(data)
             elif isinstance(raw_data, dict):
                 if "funds" not in raw_data:
@@ -183,73 +258,51 @@ class DataStorage:
                     self.save_data(data)
                 else:
                     data = raw_data
+                    self._set_cache(data, file_key)
             else:
                 logger.error(f"Unexpected data format: {type(raw_data)}")
                 return None
             
             logger.info(f"Data loaded from {self.funds_file}")
-            return data
+            return dict(data)
         except Exception as e:
             logger.error(f"Error loading data: {e}")
             return None
     
     def get_fund_by_name(self, fund_name: str) -> Optional[Dict]:
         """Get fund data by name (fuzzy matching)"""
+        # Also refreshes the name index if the file changed
         data = self.load_data()
         if not data:
             return None
         
         funds = data.get("funds", {})
         
-        # Normalize fund names for comparison
-        def normalize_name(name):
-            # Remove extra spaces, convert to lowercase
-            return ' '.join(name.lower().split())
-        
-        fund_name_normalized = normalize_name(fund_name)
-        
         # Exact match first
         if fund_name in funds:
             return funds[fund_name]
         
         # Normalized exact match
-        for stored_name, fund_data in funds.items():
-            if normalize_name(stored_name) == fund_name_normalized:
-                return fund_data
+        fund_data = self._by_normalized_name.get(_normalize_name(fund_name))
+        if fund_data is not None:
+            return fund_data
         
         # Fuzzy match - extract key words (fund type)
-        # Extract words between "Parag Parikh" and "Direct Growth"
-        def extract_fund_type(name):
-            name_lower = name.lower()
-            # Pattern: "parag parikh" ... "direct growth"
-            if 'parag parikh' in name_lower and 'direct growth' in name_lower:
-                start = name_lower.find('parag parikh') + len('parag parikh')
-                end = name_lower.find('direct growth')
-                fund_type = name_lower[start:end].strip()
-                # Remove "fund" if present
-                fund_type = fund_type.replace('fund', '').strip()
-                return fund_type
-            return None
-        
-        query_fund_type = extract_fund_type(fund_name)
+        query_fund_type = _extract_fund_type(fund_name)
         
         if query_fund_type:
-            for stored_name, fund_data in funds.items():
-                stored_fund_type = extract_fund_type(stored_name)
-                if stored_fund_type and query_fund_type in stored_fund_type or stored_fund_type in query_fund_type:
+            fund_data = self._by_fund_type.get(query_fund_type)
+            if fund_data is not None:
+                return fund_data
+            for stored_fund_type, fund_data in self._fund_types:
+                if stored_fund_type and (query_fund_type in stored_fund_type or stored_fund_type in query_fund_type):
                     return fund_data
         
-        # Last resort: partial match
-        fund_name_lower = fund_name.lower()
-        for stored_name, fund_data in funds.items():
-            stored_lower = stored_name.lower()
-            # Check if key words match
-            query_words = set(fund_name_lower.split())
-            stored_words = set(stored_lower.split())
-            # If most key words match
-            common_words = query_words.intersection(stored_words)
-            if len(common_words) >= 3:  # At least 3 common words
-                return fund_data
+        # Last resort: partial match - first stored fund sharing at least 3 name words
+        query_mask = self._word_mask(fund_name)
+        for position, mask in enumerate(self._word_masks):
+            if (mask & query_mask).bit_count() >= 3:
+                return self._fund_types[position][1]
         
         return None
     
@@ -261,6 +314,30 @@ class DataStorage:
         
         return list(data.get("funds", {}).values())
     
+    def _word_mask(self, text: str) -> int:
+        """Bitmap of the words of text that occur in stored fund names"""
+        mask = 0
+        for word in text.lower().split():
+            mask |= self._word_bits.get(word, 0)
+        return mask
+    
+    def get_funds_sharing_words(self, text: str, min_common: int = 3, reload: bool = True) -> List[str]:
+        """
+        Names of stored funds (in storage order) sharing at least min_common words with text.
+        With reload=False the already loaded name index is used without checking the file.
+        """
+        if reload:
+            # Also refreshes the name index if the file changed
+            if not self.load_data():
+                return []
+        elif self._cache is None:
+            return []
+        text_mask = self._word_mask(text)
+        return [
+            name for name, mask in zip(self._fund_names, self._word_masks)
+            if (mask & text_mask).bit_count() >= min_common
+        ]
+    
     def get_field_value(self, fund_name: str, field: str) -> Optional[Dict]:
         """
         Get a specific field value for a fund.
@@ -0,0 +1,98 @@
+"""
+Micro-batching of query embeddings
+Concurrent requests arriving within a short window are embedded with one batched call
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+from typing import Callable, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class QueryEmbeddingBatcher:
+    """Coalesces concurrent single-query embedding requests into batched calls"""
+
+    def __init__(self, embed_batch: Callable[[List[str]], List[List[float]]],
+                 max_batch_size: int = 16, max_wait_seconds: float = 0.02):
+        """
+        Args:
+            embed_batch: Function embedding a list of texts (e.g. generate_embeddings_batch)
+            max_batch_size: Maximum queries per batched call
+            max_wait_seconds: How long the first query in a batch waits for others to join
+        """
+        self.embed_batch = embed_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _ensure_worker(self):
+        # Started on first use (not in __init__) so a worker exists in each forked process
+        if self._pid != os.getpid():
+            # Forked child (gunicorn preload_app): the parent's worker thread is gone and
+            # its queue and lock may have been mid-use at fork time
+            self._worker_lock = threading.Lock()
+            self._queue = queue.Queue()
+            self._worker = None
+            self._pid = os.getpid()
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._queue = queue.Queue()
+                self._worker = threading.Thread(target=self._run, name="query-embed-batcher", daemon=True)
+                self._worker.start()
+
+    def embed(self, query: str, timeout: float = 5.0) -> List[float]:
+        """
+        Embed one query, sharing a batched model call with concurrent callers.
+        If the batch hasn't produced it within timeout seconds (e.g. a backlog behind a
+        slow call), the query is embedded directly in the calling thread instead.
+        """
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((query, future))
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            # The worker skips the query if it hasn't picked it up yet
+            future.cancel()
+            logger.warning(f"Batched query embedding timed out after {timeout}s, embedding directly")
+            return self.embed_batch([query])[0]
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait_seconds
+            try:
+                # Collect more queries until the batch is full or the wait window closes
+                while len(batch) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                pass
+
+            # Drop queries whose callers gave up waiting (and embedded them directly)
+            batch = [(query, future) for query, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            texts = [query for query, _ in batch]
+            try:
+                embeddings = self.embed_batch(texts)
+            except Exception as e:
+                logger.error(f"Batched query embedding failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                future.set_result(embedding)
@@ -0,0 +1,177 @@
+"""
+Persistent embedding cache
+Embeddings are stored in a single SQLite file keyed by SHA-256 of the text and the model name,
+so repeated texts (queries, unchanged chunks) are only embedded once across restarts
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import weakref
+from typing import List, Optional
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Caches alive in this process, so a forked child can reset their locks
+_instances = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    for cache in list(_instances):
+        # Another thread of the parent may have held the lock at fork time
+        cache._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def text_hash(text: str) -> bytes:
+    """SHA-256 digest used as the cache key for a text"""
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """SQLite-backed store of float32 embedding vectors"""
+
+    # SQLite's default limit on bound parameters is 999
+    _MAX_LOOKUP_BATCH = 900
+
+    def __init__(self, db_path: str = "data/embed_cache/embeddings.sqlite3", model: str = ""):
+        """
+        Args:
+            db_path: Path to the SQLite cache file (created if missing)
+            model: Embedding model name; vectors from different models never mix
+        """
+        self.db_path = db_path
+        self.model = model
+        self._lock = threading.Lock()
+        # Connection and the pid that opened it; a SQLite handle must not cross fork()
+        # (e.g. a pipeline built in the gunicorn master), so each process opens its own
+        self._conn_value = None
+        self._conn_pid = None
+        # Handles inherited from a parent process: kept referenced (never closed or
+        # garbage collected here) so the child can't checkpoint/unlock the parent's database
+        self._inherited_conns = []
+        _instances.add(self)
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Create the file and table now so setup errors surface at construction
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        """This process's connection, opened on first use (call with self._lock held or in __init__)"""
+        pid = os.getpid()
+        if self._conn_value is None or self._conn_pid != pid:
+            if self._conn_value is not None:
+                self._inherited_conns.append(self._conn_value)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+            # WAL lets several worker processes read while one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "text_hash BLOB NOT NULL, model TEXT NOT NULL, dim INTEGER NOT NULL, vec BLOB NOT NULL, "
+                "PRIMARY KEY (text_hash, model))"
+            )
+            conn.commit()
+            self._conn_value = conn
+            self._conn_pid = pid
+        return self._conn_value
+
+    def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Look up embeddings for texts; missing entries are None"""
+        hashes = [text_hash(text) for text in texts]
+        found = {}
+        with self._lock:
+            for i in range(0, len(hashes), self._MAX_LOOKUP_BATCH):
+                chunk = hashes[i:i + self._MAX_LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection().execute(
+                    f"SELECT text_hash, vec FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    [self.model, *chunk]
+                ).fetchall()
+                found.update(rows)
+        return [
+            np.frombuffer(found[h], dtype=np.float32) if h in found else None
+            for h in hashes
+        ]
+
+    def put_many(self, texts: List[str], embeddings):
+        """Store embeddings for texts (replacing any existing entries)"""
+        rows = []
+        for text, embedding in zip(texts, embeddings):
+            vec = np.asarray(embedding, dtype=np.float32)
+            rows.append((text_hash(text), self.model, int(vec.shape[0]), vec.tobytes()))
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (text_hash, model, dim, vec) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            conn.commit()
+
+
+class CachingEmbedder:
+    """Wraps an embedding generator, serving repeated texts from an EmbeddingCache"""
+
+    def __init__(self, embedder, cache: EmbeddingCache):
+        self.embedder = embedder
+        self.cache = cache
+
+    def __getattr__(self, name):
+        # Anything not overridden here (e.g. .model) comes from the wrapped embedder
+        return getattr(self.embedder, name)
+
+    def generate_embedding(self, text: str) -> np.ndarray:
+        """Generate (or fetch the cached) embedding for a single text"""
+        return self.generate_embeddings_batch([text])[0]
+
+    def generate_query_embedding(self, query: str) -> np.ndarray:
+        """Generate (or fetch the cached) embedding for a query"""
+        return self.generate_embedding(query)
+
+    def generate_embeddings_batch(self, texts: List[str], **kwargs) -> np.ndarray:
+        """
+        Embed texts, calling the wrapped embedder only for texts not in the cache.
+
+        Returns:
+            float32 numpy array of shape (len(texts), dimension), in the order of texts
+        """
+        if not texts:
+            # Nothing to look up - the wrapped embedder's empty result (its shape and type)
+            return self.embedder.generate_embeddings_batch(texts, **kwargs)
+        try:
+            cached = self.cache.get_many(texts)
+        except sqlite3.Error as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            return np.asarray(self.embedder.generate_embeddings_batch(texts, **kwargs), dtype=np.float32)
+
+        miss_indices = [i for i, embedding in enumerate(cached) if embedding is None]
+        computed = None
+        if miss_indices:
+            miss_texts = [texts[i] for i in miss_indices]
+            computed = np.asarray(self.embedder.generate_embeddings_batch(miss_texts, **kwargs), dtype=np.float32)
+            try:
+                self.cache.put_many(miss_texts, computed)
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+
+        logger.info(f"Embedding cache: {len(texts) - len(miss_indices)} hits, {len(miss_indices)} misses")
+        if computed is not None and len(miss_indices) == len(texts):
+            return computed
+
+        # Stitch hits and freshly computed rows back into the original order
+        dim = len(next(embedding for embedding in cached if embedding is not None))
+        embeddings = np.empty((len(texts), dim), dtype=np.float32)
+        for i, embedding in enumerate(cached):
+            if embedding is not None:
+                embeddings[i] = embedding
+        if computed is not None:
+            embeddings[miss_indices] = computed
+        return embeddings
@@ -1,28 +1,134 @@
 """
 Embedding generation module for RAG system
 Uses Google Gemini embeddings API
+All returned vectors are L2-normalized (unit norm), so cosine similarity is a dot product
 """
 
+import functools
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 import logging
 
+import numpy as np
+
+# google.generativeai is heavy (gRPC/protobuf stubs) - imported by the first EmbeddingGenerator
+genai = None
+
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    import httpx
+    HTTPX_AVAILABLE = True
 except ImportError:
-    GEMINI_AVAILABLE = False
-    logging.warning("Google Generative AI library not installed. Run: pip install google-generativeai")
+    HTTPX_AVAILABLE = False  # Query embeddings go through the SDK instead
 
 logger = logging.getLogger(__name__)
 
+# Batch requests in flight at once in generate_embeddings_batch
+BATCH_MAX_CONCURRENCY = 8
+# Concurrent single-text requests used when a batch request fails
+FALLBACK_MAX_WORKERS = 16
+# Attempts per API call when rate limited (backoff 1s, 2s, ...)
+RATE_LIMIT_ATTEMPTS = 3
+
+
+def _retry_rate_limited(call, **kwargs):
+    """Run call(**kwargs) with exponential backoff on rate-limit (429) errors"""
+    for attempt in range(RATE_LIMIT_ATTEMPTS):
+        try:
+            return call(**kwargs)
+        except Exception as e:
+            error_str = str(e).lower()
+            is_rate_limited = "429" in error_str or "rate limit" in error_str
+            if not is_rate_limited or attempt == RATE_LIMIT_ATTEMPTS - 1:
+                raise
+            delay = 2 ** attempt
+            logger.warning(f"Embedding API rate limited, retrying in {delay}s...")
+            time.sleep(delay)
+
+
+def _unit_rows(embeddings) -> List[List[float]]:
+    """L2-normalize each row of an (N, D) array-like"""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-9
+    return matrix.tolist()
+
+
+def _embed_content(**kwargs):
+    """genai.embed_content with exponential backoff on rate-limit (429) errors"""
+    return _retry_rate_limited(genai.embed_content, **kwargs)
+
+
+# Persistent client for the REST query-embedding call: the TLS connection (HTTP/2 when
+# the h2 package is installed) is reused across queries instead of per SDK call
+_GEMINI_API_BASE = "https://generativelanguage.googleapis.com"
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def _reset_http_client():
+    """A forked child must not reuse the parent's pooled sockets"""
+    global _http_client, _http_client_lock
+    _http_client = None
+    _http_client_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_http_client)
+
+
+def _get_http_client():
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                try:
+                    _http_client = httpx.Client(base_url=_GEMINI_API_BASE, http2=True, timeout=5.0)
+                except ImportError:
+                    # http2=True needs the optional h2 package
+                    _http_client = httpx.Client(base_url=_GEMINI_API_BASE, timeout=5.0)
+    return _http_client
+
+
+def _post_embed_content(model: str, api_key: str, text: str, task_type: str) -> List[float]:
+    response = _get_http_client().post(
+        f"/v1beta/{model}:embedContent",
+        params={"key": api_key},
+        json={"content": {"parts": [{"text": text}]}, "taskType": task_type}
+    )
+    response.raise_for_status()
+    return response.json()["embedding"]["values"]
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_query_embedding(model: str, api_key: str, query: str) -> tuple:
+    """Query embedding via the REST API, memoized for repeated queries"""
+    if HTTPX_AVAILABLE:
+        values = _retry_rate_limited(
+            _post_embed_content, model=model, api_key=api_key, text=query, task_type="RETRIEVAL_QUERY"
+        )
+    else:
+        values = _embed_content(model=model, content=query, task_type="RETRIEVAL_QUERY")['embedding']
+    return tuple(_unit_rows([values])[0])
+
+
+def _import_genai():
+    global genai
+    if genai is None:
+        try:
+            import google.generativeai
+        except ImportError:
+            raise ImportError("Google Generative AI library required. Install with: pip install google-generativeai")
+        genai = google.generativeai
+    return genai
+
 
 class EmbeddingGenerator:
     """Generates embeddings using Google Gemini API"""
     
     def __init__(self, api_key: Optional[str] = None, model: str = "models/embedding-001"):
-        if not GEMINI_AVAILABLE:
-            raise ImportError("Google Generative AI library required. Install with: pip install google-generativeai")
+        _import_genai()
         
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
@@ -43,12 +149,12 @@ class EmbeddingGenerator:
             List of floats representing the embedding vector
         """
         try:
-            result = genai.embed_content(
+            result = _embed_content(
                 model=self.model,
                 content=text,
                 task_type="RETRIEVAL_DOCUMENT"  # Use RETRIEVAL_QUERY for queries
             )
-            return result['embedding']
+            return _unit_rows([result['embedding']])[0]
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
             raise
@@ -56,6 +162,7 @@ class EmbeddingGenerator:
     def generate_embeddings_batch(self, texts: List[str], batch_size: int = 100) -> List[List[float]]:
         """
         Generate embeddings for multiple texts in batches.
+        Batches are requested concurrently (up to BATCH_MAX_CONCURRENCY in flight).
         
         Args:
             texts: List of texts to embed
@@ -64,31 +171,38 @@ class EmbeddingGenerator:
         Returns:
             List of embedding vectors
         """
-        all_embeddings = []
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        if len(batches) <= 1:
+            return self._embed_batch(1, batches[0]) if batches else []
         
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            logger.info(f"Generating embeddings for batch {i//batch_size + 1} ({len(batch)} texts)")
-            
-            try:
-                # Gemini can handle batch embedding
-                result = genai.embed_content(
-                    model=self.model,
-                    content=batch,
-                    task_type="RETRIEVAL_DOCUMENT"
-                )
-                batch_embeddings = result['embedding'] if isinstance(result['embedding'][0], list) else [result['embedding']]
+        all_embeddings = []
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_CONCURRENCY, len(batches))) as executor:
+            # map keeps the batches in their original order
+            for batch_embeddings in executor.map(self._embed_batch, range(1, len(batches) + 1), batches):
                 all_embeddings.extend(batch_embeddings)
-            except Exception as e:
-                logger.error(f"Error generating embeddings for batch: {e}")
-                # Fallback to individual embeddings
-                logger.info("Falling back to individual embeddings...")
-                for text in batch:
-                    embedding = self.generate_embedding(text)
-                    all_embeddings.append(embedding)
         
         return all_embeddings
     
+    def _embed_batch(self, batch_number: int, batch: List[str]) -> List[List[float]]:
+        """Embed one batch with a single request, falling back to per-text requests"""
+        logger.info(f"Generating embeddings for batch {batch_number} ({len(batch)} texts)")
+        
+        try:
+            # Gemini can handle batch embedding
+            result = _embed_content(
+                model=self.model,
+                content=batch,
+                task_type="RETRIEVAL_DOCUMENT"
+            )
+            batch_embeddings = result['embedding'] if isinstance(result['embedding'][0], list) else [result['embedding']]
+            return _unit_rows(batch_embeddings)
+        except Exception as e:
+            logger.error(f"Error generating embeddings for batch: {e}")
+            # Fallback to individual embeddings, requested concurrently (network-bound)
+            logger.info("Falling back to individual embeddings...")
+            with ThreadPoolExecutor(max_workers=min(FALLBACK_MAX_WORKERS, len(batch))) as executor:
+                return list(executor.map(self.generate_embedding, batch))
+    
     def generate_query_embedding(self, query: str) -> List[float]:
         """
         Generate embedding for a query (uses RETRIEVAL_QUERY task type).
@@ -99,18 +213,13 @@ class EmbeddingGenerator:
         Returns:
             List of floats representing the embedding vector
         """
-        import time
         start_time = time.time()
-        logger.info(f"[EMBEDDING API] Calling genai.embed_content for query: '{query[:50]}...'")
+        logger.info(f"[EMBEDDING API] Calling embedContent for query: '{query[:50]}...'")
         try:
-            result = genai.embed_content(
-                model=self.model,
-                content=query,
-                task_type="RETRIEVAL_QUERY"
-            )
+            embedding = list(_cached_query_embedding(self.model, self.api_key, query))
             elapsed = time.time() - start_time
             logger.info(f"[EMBEDDING API] ✓ Success (took {elapsed:.2f}s)")
-            return result['embedding']
+            return embedding
         except Exception as e:
             elapsed = time.time() - start_time
             logger.error(f"[EMBEDDING API] ✗ Error after {elapsed:.2f}s: {e}")
@@ -1,11 +1,18 @@
 """
 Local embedding generation using sentence-transformers
 No API key required - runs locally
+All returned vectors are L2-normalized (unit norm), so cosine similarity is a dot product
 """
 
-from typing import List, Optional
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
 import logging
 
+import numpy as np
+
+from quantization import quantize_int8, to_float16
+
 try:
     from sentence_transformers import SentenceTransformer
     SENTENCE_TRANSFORMERS_AVAILABLE = True
@@ -15,27 +22,59 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Loaded models, shared by every LocalEmbeddingGenerator in the process
+# (keyed by name/path, backend and ONNX file)
+_MODEL_CACHE: Dict[Tuple[str, str, str], "SentenceTransformer"] = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def _load_model(model_name: str, backend: str = "torch", onnx_file: str = "") -> "SentenceTransformer":
+    """Load a sentence-transformers model once per process"""
+    key = (model_name, backend, onnx_file)
+    with _MODEL_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is not None:
+            logger.info(f"Reusing loaded embedding model: {model_name}")
+            return model
+        
+        if os.path.isdir(model_name):
+            # Bundled model: weights are read from local disk (safetensors are mmap'd)
+            logger.info(f"Loading local embedding model from path: {model_name} (backend: {backend})")
+        else:
+            logger.info(f"Loading local embedding model: {model_name} (backend: {backend})")
+        kwargs = {}
+        if backend != "torch":
+            # Only passed when needed - older sentence-transformers has no backend argument
+            kwargs["backend"] = backend
+            if onnx_file:
+                kwargs["model_kwargs"] = {"file_name": onnx_file}
+        # ST_CACHE points the Hub download cache somewhere persistent (e.g. /tmp/st)
+        model = SentenceTransformer(model_name, cache_folder=os.getenv("ST_CACHE") or None, **kwargs)
+        _MODEL_CACHE[key] = model
+        logger.info("Model loaded successfully")
+        return model
+
 
 class LocalEmbeddingGenerator:
     """Generates embeddings using local sentence-transformers model"""
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", backend: str = "torch", onnx_file: str = ""):
         """
         Initialize local embedding generator.
         
         Args:
-            model_name: Sentence transformer model name
+            model_name: Sentence transformer model name, or path to a saved model directory
                        Options: "all-MiniLM-L6-v2" (fast, 384 dims)
                                "all-mpnet-base-v2" (better quality, 768 dims)
+            backend: "torch" or "onnx" (ONNX Runtime, faster on CPU)
+            onnx_file: ONNX file within the model repo, e.g. "onnx/model_qint8_avx512_vnni.onnx"
         """
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             raise ImportError("sentence-transformers required. Install with: pip install sentence-transformers")
         
-        logger.info(f"Loading local embedding model: {model_name}")
-        self.model = SentenceTransformer(model_name)
-        logger.info("Model loaded successfully")
+        self.model = _load_model(model_name, backend, onnx_file)
     
-    def generate_embedding(self, text: str) -> List[float]:
+    def generate_embedding(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text.
         
@@ -43,16 +82,17 @@ class LocalEmbeddingGenerator:
             text: Text to embed
             
         Returns:
-            List of floats representing the embedding vector
+            float32 numpy array representing the embedding vector
         """
         try:
-            embedding = self.model.encode(text, convert_to_numpy=False)
-            return embedding.tolist() if hasattr(embedding, 'tolist') else list(embedding)
+            return self.model.encode(
+                [text], convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False
+            )[0]
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
             raise
     
-    def generate_embeddings_batch(self, texts: List[str], batch_size: int = 32) -> List[List[float]]:
+    def generate_embeddings_batch(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
         """
         Generate embeddings for multiple texts in batches.
         
@@ -61,28 +101,37 @@ class LocalEmbeddingGenerator:
             batch_size: Number of texts to process in each batch
             
         Returns:
-            List of embedding vectors
+            float32 numpy array of shape (len(texts), dimension)
         """
-        all_embeddings = []
+        if not texts:
+            return np.empty((0, self.model.get_sentence_embedding_dimension()), dtype=np.float32)
         
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            logger.info(f"Generating embeddings for batch {i//batch_size + 1} ({len(batch)} texts)")
-            
-            try:
-                embeddings = self.model.encode(batch, convert_to_numpy=False, show_progress_bar=False)
-                # Convert to list format
-                if isinstance(embeddings, list):
-                    all_embeddings.extend([emb.tolist() if hasattr(emb, 'tolist') else list(emb) for emb in embeddings])
-                else:
-                    all_embeddings.extend([emb.tolist() if hasattr(emb, 'tolist') else list(emb) for emb in embeddings])
-            except Exception as e:
-                logger.error(f"Error generating embeddings for batch: {e}")
-                raise
+        logger.info(f"Generating embeddings for {len(texts)} texts")
+        try:
+            # One call over the whole list: encode sorts texts by length before batching,
+            # so short field chunks aren't padded to the length of comprehensive chunks
+            return self.model.encode(
+                texts, batch_size=batch_size, convert_to_numpy=True,
+                normalize_embeddings=True, show_progress_bar=False
+            )
+        except Exception as e:
+            logger.error(f"Error generating embeddings for batch: {e}")
+            raise
+    
+    def generate_embeddings_int8(self, texts: List[str], batch_size: int = 64) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate int8-quantized embeddings (4x smaller than float32).
         
-        return all_embeddings
+        Returns:
+            Tuple of (int8 matrix, float32 per-vector scales); see quantization.dequantize_int8
+        """
+        return quantize_int8(self.generate_embeddings_batch(texts, batch_size=batch_size))
+    
+    def generate_embeddings_fp16(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """Generate float16 embeddings (2x smaller than float32)"""
+        return to_float16(self.generate_embeddings_batch(texts, batch_size=batch_size))
     
-    def generate_query_embedding(self, query: str) -> List[float]:
+    def generate_query_embedding(self, query: str) -> np.ndarray:
         """
         Generate embedding for a query (same as generate_embedding for local models).
         
@@ -90,7 +139,7 @@ class LocalEmbeddingGenerator:
             query: Query text to embed
             
         Returns:
-            List of floats representing the embedding vector
+            float32 numpy array representing the embedding vector
         """
         return self.generate_embedding(query)
 
@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration for the RAG backend API
+Usage: gunicorn -c gunicorn.conf.py backend_rag_api:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5001')}"
+
+# Worker settings - gevent workers keep serving other requests while one waits on the LLM.
+# The embedding model and vector store are shared copy-on-write (preload_app below), so
+# extra workers cost little memory; size WEB_CONCURRENCY by CPU cores for the embedding
+# and search work, and let worker_connections cover the concurrent LLM waits.
+workers = int(os.getenv("WEB_CONCURRENCY", 2))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gevent")
+worker_connections = 100
+keepalive = 5
+timeout = 120  # Allow for slow LLM responses
+
+# Load the app once in the master and fork workers from it, so the RAG pipeline
+# (embedding model + vector store) is built once and shared copy-on-write.
+preload_app = True
+os.environ.setdefault("RAG_EAGER_INIT", "true")
+
+# Have backend_rag_api monkey-patch the stdlib first thing at import (the app is
+# imported in the master, before gunicorn's own worker-side patching runs)
+if worker_class == "gevent":
+    os.environ.setdefault("GEVENT_PATCH", "1")
@@ -8,6 +8,12 @@ from datetime import datetime
 from scraper import GrowwMFScraper
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False  # Fall back to stdlib json
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,8 +48,12 @@ def save_results(data: list, filename: str = None):
         "funds": data
     }
     
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
     
     logger.info(f"Results saved to {filename}")
     return filename
@@ -93,8 +103,14 @@ def print_summary(data: list):
     print("="*60 + "\n")
 
 
-def main():
-    """Main execution function"""
+def run() -> dict:
+    """
+    Scrape all funds and save the results, without printing.
+    Importable entry point (used by the backend /init endpoint).
+    
+    Returns:
+        Status dictionary with the scraped results and output filename
+    """
     logger.info("Starting Groww mutual fund scraper")
     
     scraper = GrowwMFScraper()
@@ -105,12 +121,24 @@ def main():
     # Save results
     filename = save_results(results)
     
-    # Print summary
-    print_summary(results)
-    
     logger.info(f"Scraping completed. Results saved to {filename}")
     
-    return results
+    return {
+        "success": True,
+        "results": results,
+        "funds_scraped": len(results),
+        "output_file": filename
+    }
+
+
+def main():
+    """Main execution function"""
+    status = run()
+    
+    # Print summary
+    print_summary(status["results"])
+    
+    return status["results"]
 
 
 if __name__ == "__main__":
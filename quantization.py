@@ -0,0 +1,35 @@
+"""
+Embedding quantization helpers
+int8 (symmetric, one float32 scale per vector) and float16 encodings of embedding matrices
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+def quantize_int8(embeddings) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize embeddings to int8 with a per-vector scale (max |v| / 127).
+    
+    Args:
+        embeddings: Vector or (N, D) matrix of embeddings
+        
+    Returns:
+        Tuple of (int8 matrix of shape (N, D), float32 scales of shape (N,))
+    """
+    mat = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+    scales = np.abs(mat).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0  # all-zero rows stay zero
+    quantized = np.clip(np.rint(mat / scales[:, None]), -127, 127).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+
+def dequantize_int8(quantized: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Reconstruct float32 embeddings from quantize_int8 output"""
+    return quantized.astype(np.float32) * scales[:, None]
+
+
+def to_float16(embeddings) -> np.ndarray:
+    """Half-precision copy of embeddings (2x smaller, ~3 significant digits)"""
+    return np.asarray(embeddings, dtype=np.float32).astype(np.float16)
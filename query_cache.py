@@ -0,0 +1,229 @@
+"""
+Response cache for RAG queries
+Two tiers: exact match on the normalized query string, then semantic match on
+the query embedding (cosine similarity above a threshold)
+"""
+
+import contextlib
+import itertools
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import logging
+
+import numpy as np
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False  # e.g. Windows: saves are not serialized between processes
+
+logger = logging.getLogger(__name__)
+
+
+class QueryResponseCache:
+    """Bounded, TTL-limited cache of answered queries"""
+
+    def __init__(self, max_entries: int = 512, similarity_threshold: float = 0.95,
+                 ttl_seconds: float = 3600):
+        """
+        Args:
+            max_entries: Maximum entries kept in each tier
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            ttl_seconds: Entries older than this are treated as misses
+        """
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        # Exact tier: normalized query -> (timestamp, response), in LRU order
+        self._exact: "OrderedDict[str, tuple]" = OrderedDict()
+
+        # Semantic tier: ring buffer of unit-norm query embeddings (allocated on first put)
+        self._vectors: Optional[np.ndarray] = None
+        self._entries: List[Optional[tuple]] = [None] * max_entries
+        self._size = 0
+        self._next = 0
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Case- and whitespace-insensitive cache key"""
+        return " ".join(query.lower().split())
+
+    @staticmethod
+    def _unit(embedding) -> np.ndarray:
+        vec = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm > 0 else vec
+
+    def _fresh(self, timestamp: float) -> bool:
+        return time.time() - timestamp <= self.ttl_seconds
+
+    def get_exact(self, query: str) -> Optional[Dict]:
+        """Return the cached response for an identical (normalized) query, if any"""
+        key = self.normalize_query(query)
+        with self._lock:
+            entry = self._exact.get(key)
+            if entry is None:
+                return None
+            if not self._fresh(entry[0]):
+                del self._exact[key]
+                return None
+            self._exact.move_to_end(key)
+            return entry[1]
+
+    def get_similar(self, embedding) -> Optional[Dict]:
+        """Return the cached response of the most similar earlier query above the threshold"""
+        with self._lock:
+            if not self._size:
+                return None
+            query_vec = self._unit(embedding)
+            if query_vec.shape[0] != self._vectors.shape[1]:
+                return None
+            similarities = self._vectors[:self._size] @ query_vec
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                return None
+            timestamp, response = self._entries[best]
+            if not self._fresh(timestamp):
+                return None
+            logger.info(f"Semantic cache hit (similarity {similarities[best]:.3f})")
+            return response
+
+    def put(self, query: str, embedding, response: Dict):
+        """Store a response under both tiers"""
+        now = time.time()
+        key = self.normalize_query(query)
+        query_vec = self._unit(embedding) if embedding is not None else None
+        with self._lock:
+            self._put_exact(key, now, response)
+            if query_vec is not None:
+                self._put_vector(query_vec, now, response)
+
+    def _put_exact(self, key: str, timestamp: float, response: Dict):
+        self._exact[key] = (timestamp, response)
+        self._exact.move_to_end(key)
+        while len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+
+    def _put_vector(self, query_vec: np.ndarray, timestamp: float, response: Dict):
+        if self._vectors is None or self._vectors.shape[1] != query_vec.shape[0]:
+            self._vectors = np.zeros((self.max_entries, query_vec.shape[0]), dtype=np.float32)
+            self._entries = [None] * self.max_entries
+            self._size = 0
+            self._next = 0
+        # Overwrite the oldest slot once the ring buffer is full
+        self._vectors[self._next] = query_vec
+        self._entries[self._next] = (timestamp, response)
+        self._next = (self._next + 1) % self.max_entries
+        self._size = min(self._size + 1, self.max_entries)
+
+    def _snapshot(self):
+        """Fresh entries of both tiers, oldest first: (key, ts, response) and (vector, ts, response)"""
+        with self._lock:
+            exact = [(key, ts, response) for key, (ts, response) in self._exact.items() if self._fresh(ts)]
+            # Ring buffer slots from oldest to newest
+            order = [(self._next + i) % self.max_entries for i in range(self.max_entries)] \
+                if self._size == self.max_entries else range(self._size)
+            semantic = [
+                (self._vectors[slot].copy(),) + self._entries[slot]
+                for slot in order if self._fresh(self._entries[slot][0])
+            ]
+        return exact, semantic
+
+    def _merge(self, saved: list, current: list, key) -> list:
+        """Fresh entries of both lists, the newest per key, oldest first (at most max_entries)"""
+        newest = {}
+        for entry in itertools.chain(saved, current):
+            entry_key = key(entry)
+            if self._fresh(entry[1]) and (entry_key not in newest or newest[entry_key][1] <= entry[1]):
+                newest[entry_key] = entry
+        return sorted(newest.values(), key=lambda entry: entry[1])[-self.max_entries:]
+
+    @staticmethod
+    def _vectors_path(path: str) -> str:
+        """The semantic tier's query embeddings are kept in a .npy file next to the JSON file"""
+        return f"{os.path.splitext(path)[0]}.npy"
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _file_lock(path: str, exclusive: bool):
+        """Lock serializing saves (and reads against saves) between worker processes"""
+        if not FCNTL_AVAILABLE:
+            yield
+            return
+        with open(f"{path}.lock", 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+
+    def _read(self, path: str):
+        """Entries written by save(), in the _snapshot() format (empty if there is no file)"""
+        if not os.path.exists(path):
+            return [], []
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        exact = [tuple(entry) for entry in data.get("exact", [])]
+        semantic = data.get("semantic", [])
+        if semantic:
+            # Plain array file: np.load refuses pickled objects
+            vectors = np.load(self._vectors_path(path))
+            if len(vectors) != len(semantic):
+                logger.warning(f"Cached query embeddings don't match {path}, skipping the semantic tier")
+                return exact, []
+            semantic = [(vec, ts, response) for vec, (ts, response) in zip(vectors, semantic)]
+        return exact, semantic
+
+    def save(self, path: str):
+        """
+        Write the fresh entries of both tiers to path (JSON, query embeddings in a .npy
+        file next to it). Entries other workers saved there are merged in, keeping the
+        newest per query, so the last worker to exit doesn't drop the others' answers.
+        """
+        exact, semantic = self._snapshot()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        vectors_path = self._vectors_path(path)
+        tmp_suffix = f".{os.getpid()}.tmp"
+        with self._file_lock(path, exclusive=True):
+            saved_exact, saved_semantic = self._read(path)
+            exact = self._merge(saved_exact, exact, key=lambda entry: entry[0])
+            semantic = self._merge(saved_semantic, semantic, key=lambda entry: entry[0].tobytes())
+            # Write then rename, so a crash never leaves a partial file
+            with open(vectors_path + tmp_suffix, 'wb') as f:
+                np.save(f, np.array([vec for vec, _, _ in semantic], dtype=np.float32))
+            with open(path + tmp_suffix, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "exact": exact,
+                    "semantic": [(ts, response) for _, ts, response in semantic]
+                }, f)
+            os.replace(vectors_path + tmp_suffix, vectors_path)
+            os.replace(path + tmp_suffix, path)
+        logger.info(f"Saved {len(exact)} cached responses to {path}")
+
+    def load(self, path: str):
+        """Restore entries written by save(); expired entries are skipped"""
+        if not os.path.exists(path):
+            return
+        with self._file_lock(path, exclusive=False):
+            exact, semantic = self._read(path)
+        with self._lock:
+            for key, timestamp, response in exact:
+                if self._fresh(timestamp):
+                    self._put_exact(key, timestamp, response)
+            for query_vec, timestamp, response in semantic:
+                if self._fresh(timestamp):
+                    self._put_vector(query_vec, timestamp, response)
+        logger.info(f"Loaded {len(self._exact)} cached responses from {path}")
+
+    def clear(self):
+        """Drop all cached responses"""
+        with self._lock:
+            self._exact.clear()
+            self._vectors = None
+            self._entries = [None] * self.max_entries
+            self._size = 0
+            self._next = 0
@@ -2,15 +2,21 @@
 RAG Pipeline - Main component for Retrieval Augmented Generation
 """
 
+import functools
+import itertools
 import os
 import re
-from typing import Dict, List, Optional
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
 import logging
 
 from data_storage import DataStorage
 from data_chunking import FundDataChunker
-from embeddings import EmbeddingGenerator
+from embedding_batcher import QueryEmbeddingBatcher
+from embedding_cache import CachingEmbedder, EmbeddingCache
 from embeddings_local import LocalEmbeddingGenerator
+from query_cache import QueryResponseCache
 import config_rag
 
 # Use simple vector store for Vercel (lighter than ChromaDB)
@@ -21,28 +27,143 @@ except ImportError:
     from vector_store import VectorStore
     SIMPLE_VECTOR_STORE = False
 
+try:
+    from vector_store_faiss import FAISS_AVAILABLE, FaissVectorStore
+except ImportError:
+    FAISS_AVAILABLE = False
+
 try:
     from groq import Groq
     GROQ_AVAILABLE = True
 except ImportError:
     GROQ_AVAILABLE = False
 
-# Keep Gemini import for backward compatibility (if needed)
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    import httpx
+    HTTPX_AVAILABLE = True
 except ImportError:
-    GEMINI_AVAILABLE = False
+    HTTPX_AVAILABLE = False  # Groq creates its own client
 
 logger = logging.getLogger(__name__)
 
+# HTTP client for Groq API calls, shared by every pipeline in the process
+_shared_http_client = None
+_shared_http_client_lock = threading.Lock()
+
+
+def _reset_shared_http_client():
+    """A forked child (gunicorn preload_app) must not reuse the parent's pooled sockets"""
+    global _shared_http_client, _shared_http_client_lock
+    _shared_http_client = None
+    _shared_http_client_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shared_http_client)
+
+
+def _get_shared_http_client():
+    """Shared keep-alive client: the TLS connection is reused across queries (and pipelines)
+    instead of being re-established after idle gaps"""
+    global _shared_http_client
+    if _shared_http_client is None and HTTPX_AVAILABLE:
+        with _shared_http_client_lock:
+            if _shared_http_client is None:
+                _shared_http_client = httpx.Client(
+                    timeout=60.0,
+                    limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300)
+                )
+    return _shared_http_client
+
+
+# Chunks embedded per call while building the index
+INDEX_BATCH_SIZE = 256
+
+# Instructions shared by every query. Sent as the system message so each request starts
+# with the same token prefix (cacheable by the provider); only context + question vary.
+_SYSTEM_PROMPT = """You are a helpful assistant that answers questions about mutual funds based on provided factual information.
+
+IMPORTANT RULES:
+1. Only use information from the provided context
+2. Provide factual answers only - NO investment advice
+3. Always mention the exact fund name from the context in your answer
+4. For returns queries, look for fields like "1 Year Returns", "3 Year Returns", "5 Year Returns", "Returns Since Inception" in the context
+5. If the specific fund mentioned in the question is NOT in the context, explicitly state: "The fund [fund name] is not available in the database. This fund may not exist on Groww, the URL may have changed, or the data could not be scraped successfully. Available funds include: ELSS Tax Saver, Conservative Hybrid, Liquid, Arbitrage, Dynamic Asset Allocation, and Long Term Value funds."
+6. If the information about the fund exists but the specific field is missing, say: "The [field] for [fund name] is not available in the context."
+7. Keep answers concise and factual
+8. Do not make up or infer information not explicitly stated
+9. Do NOT provide source URLs in your answer - they will be added separately
+10. When answering about returns, include the exact percentage values from the context (e.g., "9.49%" or "80.90%")"""
+
+_SYSTEM_MESSAGE = {"role": "system", "content": _SYSTEM_PROMPT}
+
+# Fixed parts of the user prompt around the retrieved context and the question
+_PROMPT_PREFIX = "Context (factual information about mutual funds):\n"
+_PROMPT_MID = "\n\nQuestion: "
+_PROMPT_SUFFIX = (
+    "\n\nAnswer the question using only the information from the context above. Be factual and concise. "
+    "Do not provide investment advice. If the fund is not in the context, clearly state that."
+)
+
+# Spelling variants of fund-type words in queries, rewritten to the stored names' form
+# in one pass ("elss tax saver fund" is left as is)
+_QUERY_VARIANTS = {
+    "flexicap": "flexi cap",
+    "flexi-cap": "flexi cap",
+    "elss tax saver": "elss tax saver fund",
+    "elss fund": "elss tax saver fund",
+}
+_QUERY_VARIANT_RE = re.compile(r'flexicap|flexi-cap|elss tax saver(?! fund)|elss fund')
+
+# Field labels read by the fallback extractor, found in a single pass over the context.
+# The value sits in a lookahead so a label inside another label's value is still matched.
+_FIELD_RE = re.compile(
+    r'(?P<key>exit load|exitload|expense ratio|minimum sip|minimum investment|lock[-\s]?in'
+    r'|riskometer|risk level|benchmark)[:\s]+(?=(?P<val>[^\n]+))',
+    re.IGNORECASE
+)
+
+# Single-field lookups the extractor can answer without the LLM
+_FIELD_QUERY_RE = re.compile(
+    r'exit ?load|expense ?ratio|minimum sip|min sip|minimum investment|lock[-\s]?in|riskometer|risk level|benchmark'
+)
+# Words a single-field lookup may contain besides the field label and the fund's name;
+# anything else ("why", "and 3 year return") needs the LLM
+_FIELD_QUERY_FILLER = frozenset((
+    "what", "whats", "s", "is", "the", "of", "for", "a", "an", "in", "on", "this", "its",
+    "tell", "me", "show", "give", "please", "about", "how", "much", "does", "do", "have", "has",
+    "current", "value", "amount", "period", "fund", "scheme", "plan", "mutual"
+))
+_QUERY_WORD_RE = re.compile(r'[a-z0-9]+')
+
+# Answer phrases saying the fund itself doesn't exist (vs. just some data missing)
+_FUND_NOT_FOUND_RE = re.compile(
+    "is not available in the database|is not in the database|does not exist"
+    "|may not exist|not found in the database"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _name_words(name: str, min_length: int = 0) -> frozenset:
+    """Words of a (lowercased) fund name longer than min_length, computed once per name"""
+    return frozenset(word for word in name.split() if len(word) > min_length)
+
 
 class RAGPipeline:
     """Complete RAG pipeline for answering queries"""
     
-    def __init__(self, api_key: Optional[str] = None, use_local_embeddings: bool = False):
+    def __init__(self, api_key: Optional[str] = None, use_local_embeddings: bool = False,
+                 http_client=None):
+        """
+        Args:
+            api_key: Groq API key (defaults to config_rag.GROQ_API_KEY)
+            use_local_embeddings: Kept for compatibility - local embeddings are always used
+            http_client: Optional httpx.Client for Groq API calls (defaults to a keep-alive
+                         client shared by all pipelines in the process)
+        """
         # Initialize components
         self.storage = DataStorage()
+        self.refresh_fund_list()
         self.chunker = FundDataChunker(
             chunk_size=config_rag.CHUNK_SIZE,
             chunk_overlap=config_rag.CHUNK_OVERLAP
@@ -50,9 +171,29 @@ class RAGPipeline:
         
         # Initialize embeddings - Always use local embeddings (Groq doesn't provide embeddings)
         logger.info("Using local embeddings (sentence-transformers) - Groq doesn't provide embeddings")
-        self.embedder = LocalEmbeddingGenerator()
+        self.embedder = LocalEmbeddingGenerator(
+            model_name=config_rag.LOCAL_EMBEDDING_MODEL,
+            backend=config_rag.LOCAL_EMBEDDING_BACKEND,
+            onnx_file=config_rag.LOCAL_EMBEDDING_ONNX_FILE
+        )
+        if config_rag.EMBEDDING_CACHE_PATH:
+            # Unchanged chunks (and repeated queries) are embedded once across runs
+            try:
+                self.embedder = CachingEmbedder(
+                    self.embedder,
+                    EmbeddingCache(config_rag.EMBEDDING_CACHE_PATH, model=self._embedding_cache_model())
+                )
+            except Exception as e:
+                # e.g. read-only filesystem - run without the cache
+                logger.warning(f"Embedding cache disabled: {e}")
+        # Queries embedded concurrently (e.g. by several API requests) share one batched call
+        self.query_batcher = QueryEmbeddingBatcher(
+            self.embedder.generate_embeddings_batch,
+            max_batch_size=config_rag.QUERY_BATCH_SIZE,
+            max_wait_seconds=config_rag.QUERY_BATCH_WAIT_SECONDS
+        )
         
-        self.vector_store = VectorStore(db_path=config_rag.VECTOR_DB_PATH)
+        self.vector_store = self._create_vector_store()
         
         # Initialize Groq LLM for answer generation
         groq_api_key = api_key or config_rag.GROQ_API_KEY
@@ -62,9 +203,91 @@ class RAGPipeline:
         if not GROQ_AVAILABLE:
             raise ImportError("Groq library required. Install with: pip install groq")
         
-        self.groq_client = Groq(api_key=groq_api_key)
+        self._groq_api_key = groq_api_key
+        self._http_client = http_client
+        self._groq_client = Groq(api_key=groq_api_key, http_client=http_client or _get_shared_http_client())
+        self._groq_client_pid = os.getpid()
         self.llm_model_name = config_rag.GROQ_LLM_MODEL
+        # Generation settings are the same for every query - built once, passed as **kwargs
+        self._completion_kwargs = {
+            "model": self.llm_model_name,
+            "temperature": config_rag.TEMPERATURE,
+            "max_tokens": config_rag.MAX_TOKENS
+        }
         logger.info(f"Initialized Groq LLM with model: {self.llm_model_name}")
+        
+        # Answered queries (default top_k only), reused for repeated questions
+        self.response_cache = QueryResponseCache(
+            max_entries=config_rag.RESPONSE_CACHE_SIZE,
+            similarity_threshold=config_rag.RESPONSE_CACHE_SIMILARITY,
+            ttl_seconds=config_rag.RESPONSE_CACHE_TTL_SECONDS
+        )
+        if config_rag.RESPONSE_CACHE_PATH:
+            # Responses answered before a restart (and still within the TTL)
+            try:
+                self.response_cache.load(config_rag.RESPONSE_CACHE_PATH)
+            except Exception as e:
+                logger.warning(f"Failed to load response cache: {e}")
+    
+    @property
+    def groq_client(self):
+        """Groq client of the current process - one created before a fork (gunicorn
+        preload_app) would share its pooled connections with the parent"""
+        if self._groq_client_pid != os.getpid():
+            self._groq_client = Groq(
+                api_key=self._groq_api_key,
+                http_client=self._http_client or _get_shared_http_client()
+            )
+            self._groq_client_pid = os.getpid()
+        return self._groq_client
+    
+    def save_response_cache(self):
+        """Persist the response cache to RESPONSE_CACHE_PATH (if configured)"""
+        if not config_rag.RESPONSE_CACHE_PATH:
+            return
+        try:
+            self.response_cache.save(config_rag.RESPONSE_CACHE_PATH)
+        except Exception as e:
+            # e.g. read-only filesystem
+            logger.warning(f"Failed to save response cache: {e}")
+    
+    @staticmethod
+    def _create_vector_store(load_existing: bool = True):
+        """Vector store for config_rag's backend settings (empty if not load_existing)"""
+        if SIMPLE_VECTOR_STORE and config_rag.VECTOR_STORE_BACKEND == "faiss" and FAISS_AVAILABLE:
+            return FaissVectorStore(
+                db_path=config_rag.VECTOR_DB_PATH,
+                ann_backend=config_rag.ANN_BACKEND,
+                ann_min_vectors=config_rag.ANN_MIN_VECTORS,
+                load_existing=load_existing
+            )
+        if SIMPLE_VECTOR_STORE:
+            if config_rag.VECTOR_STORE_BACKEND == "faiss":
+                logger.warning("FAISS not installed - using the numpy vector store")
+            return VectorStore(
+                db_path=config_rag.VECTOR_DB_PATH, precision=config_rag.VECTOR_STORE_PRECISION,
+                load_existing=load_existing
+            )
+        vector_store = VectorStore(db_path=config_rag.VECTOR_DB_PATH)
+        if not load_existing and vector_store.get_collection_count() > 0:
+            # ChromaDB shares the persisted collection between clients - cleared in place
+            vector_store.clear_collection()
+        return vector_store
+    
+    @staticmethod
+    def _embedding_cache_model() -> str:
+        """Embedding cache key for the configured model - quantized ONNX vectors differ slightly"""
+        if config_rag.LOCAL_EMBEDDING_BACKEND == "torch":
+            return config_rag.LOCAL_EMBEDDING_MODEL
+        return f"{config_rag.LOCAL_EMBEDDING_MODEL}:{config_rag.LOCAL_EMBEDDING_BACKEND}:{config_rag.LOCAL_EMBEDDING_ONNX_FILE}"
+    
+    def refresh_fund_list(self):
+        """
+        Load the stored fund names matched against queries. Queries use the loaded list
+        without touching the funds file; build_index reloads it, so call this only when
+        the file changes without an index rebuild.
+        """
+        self.storage.load_data()
     
     def build_index(self):
         """
@@ -73,7 +296,7 @@ class RAGPipeline:
         """
         logger.info("Building vector index...")
         
-        # Load fund data
+        # Load fund data (also refreshes the fund list queries are matched against)
         funds_data = self.storage.load_data()
         if not funds_data:
             raise ValueError("No fund data found. Run data_storage.py first to collect data.")
@@ -101,42 +324,191 @@ class RAGPipeline:
                 else:
                     invalid_funds[name] = fund
             
+            # Replaces the key of load_data's top-level copy (the nested dicts are cached)
             funds_data["funds"] = valid_funds
             logger.info(f"Filtered to {len(valid_funds)} valid funds for indexing")
             if invalid_funds:
                 logger.info(f"Skipped {len(invalid_funds)} invalid/failed funds: {list(invalid_funds.keys())}")
         
-        # Check if index already exists
+        # Build into a new store and swap it in at the end: queries running meanwhile
+        # keep searching the old one, which is never modified
         if self.vector_store.get_collection_count() > 0:
-            logger.warning("Vector index already exists. Clearing and rebuilding...")
-            self.vector_store.clear_collection()
-        
-        # Create chunks
-        chunks = self.chunker.create_chunks_from_all_funds(funds_data)
-        
-        # Generate embeddings
-        texts = [chunk["text"] for chunk in chunks]
-        embeddings = self.embedder.generate_embeddings_batch(texts)
+            logger.warning("Vector index already exists. Rebuilding...")
+        vector_store = self._create_vector_store(load_existing=False)
+        
+        # Create chunks and embed them in fixed-size batches as they are produced
+        chunks = []
+        embeddings = []
+        chunk_iter = self.chunker.iter_chunks_from_all_funds(funds_data)
+        while True:
+            batch = list(itertools.islice(chunk_iter, INDEX_BATCH_SIZE))
+            if not batch:
+                break
+            embeddings.extend(self.embedder.generate_embeddings_batch([chunk["text"] for chunk in batch]))
+            chunks.extend(batch)
         
         # Store in vector database
-        self.vector_store.add_chunks(chunks, embeddings)
+        vector_store.add_chunks(chunks, embeddings)
+        self.vector_store = vector_store
+        
+        # Cached answers were produced from the old index
+        self.response_cache.clear()
         
         logger.info(f"Index built successfully with {len(chunks)} chunks")
         return len(chunks)
     
-    def answer_query(self, query: str) -> Dict:
+    def answer_query(self, query: str, top_k: Optional[int] = None,
+                     query_embedding: Optional[List[float]] = None) -> Dict:
         """
         Answer a query using RAG pipeline.
         
         Args:
             query: Natural language query
+            top_k: Number of chunks to retrieve (defaults to config_rag.TOP_K_RETRIEVAL)
+            query_embedding: Precomputed embedding of the query (skips Step 1)
             
         Returns:
-            Dictionary with answer, source URLs, and metadata
+            Dictionary that always has success, answer, source_urls, query and
+            retrieved_chunks, plus optional metadata (mode, note)
         """
-        import time
+        # A custom top_k changes the answer, so only default requests use the cache
+        use_cache = top_k is None
+        if use_cache:
+            cached = self._cached_response(query)
+            if cached is not None:
+                return cached
+        
         query_start_time = time.time()
         
+        query_embedding = self._embed_query(query, query_embedding)
+        if use_cache:
+            # Semantic tier: a paraphrase of an answered query skips retrieval and the LLM
+            cached = self._cached_response(query, query_embedding)
+            if cached is not None:
+                return cached
+        
+        retrieved_chunks = self._retrieve_chunks(query_embedding, top_k)
+        if not retrieved_chunks:
+            return self._no_results_response(query)
+        
+        prompt, query_normalized, retrieved_fund_names = self._build_prompt(query, retrieved_chunks)
+        
+        result = self._extractive_response(query, retrieved_chunks, query_normalized, retrieved_fund_names)
+        if result is not None:
+            if use_cache:
+                self.response_cache.put(query, query_embedding, result)
+            return result
+        
+        try:
+            logger.info(f"Step 4: Generating answer with Groq LLM (Expected: 1 Groq API call)")
+            logger.info(f"[GROQ API] Calling chat.completions.create with prompt length: {len(prompt)} chars")
+            llm_start = time.time()
+            
+            # Use Groq API
+            response = self.groq_client.chat.completions.create(
+                messages=self._build_messages(prompt),
+                **self._completion_kwargs
+            )
+            llm_time = time.time() - llm_start
+            
+            answer = response.choices[0].message.content.strip()
+            total_time = time.time() - query_start_time
+            logger.info(f"[GROQ API] ✓ Success (API call #1, took {llm_time:.2f}s)")
+            logger.info("="*70)
+            logger.info(f"QUERY COMPLETE - Total API calls: 1 (Groq LLM only, embeddings are local), Total time: {total_time:.2f}s")
+            logger.info("="*70)
+            
+            result = self._answer_response(query, answer, retrieved_chunks, query_normalized, retrieved_fund_names)
+            if use_cache:
+                self.response_cache.put(query, query_embedding, result)
+            return result
+            
+        except Exception as e:
+            return self._generation_error_response(e, query, retrieved_chunks, query_normalized, retrieved_fund_names)
+    
+    def answer_query_stream(self, query: str, top_k: Optional[int] = None,
+                            query_embedding: Optional[List[float]] = None) -> Iterator[Dict]:
+        """
+        Streaming variant of answer_query.
+        
+        Yields {"type": "token", "text": ...} events as the LLM generates the answer, then a
+        single {"type": "done", ...} event with the same fields answer_query returns. The
+        answer in the final event is authoritative (e.g. if the fallback extraction kicks in).
+        A cached answer is returned as a single "done" event.
+        """
+        use_cache = top_k is None
+        if use_cache:
+            cached = self._cached_response(query)
+            if cached is not None:
+                yield {"type": "done", **cached}
+                return
+        
+        query_start_time = time.time()
+        
+        query_embedding = self._embed_query(query, query_embedding)
+        if use_cache:
+            cached = self._cached_response(query, query_embedding)
+            if cached is not None:
+                yield {"type": "done", **cached}
+                return
+        
+        retrieved_chunks = self._retrieve_chunks(query_embedding, top_k)
+        if not retrieved_chunks:
+            yield {"type": "done", **self._no_results_response(query)}
+            return
+        
+        prompt, query_normalized, retrieved_fund_names = self._build_prompt(query, retrieved_chunks)
+        
+        result = self._extractive_response(query, retrieved_chunks, query_normalized, retrieved_fund_names)
+        if result is not None:
+            if use_cache:
+                self.response_cache.put(query, query_embedding, result)
+            yield {"type": "done", **result}
+            return
+        
+        try:
+            logger.info(f"Step 4: Streaming answer from Groq LLM (Expected: 1 Groq API call)")
+            logger.info(f"[GROQ API] Calling chat.completions.create (stream) with prompt length: {len(prompt)} chars")
+            stream = self.groq_client.chat.completions.create(
+                messages=self._build_messages(prompt),
+                stream=True,
+                **self._completion_kwargs
+            )
+            
+            parts = []
+            for chunk in stream:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    parts.append(text)
+                    yield {"type": "token", "text": text}
+            
+            answer = "".join(parts).strip()
+            total_time = time.time() - query_start_time
+            logger.info(f"[GROQ API] ✓ Stream complete, Total time: {total_time:.2f}s")
+            result = self._answer_response(query, answer, retrieved_chunks, query_normalized, retrieved_fund_names)
+            if use_cache:
+                self.response_cache.put(query, query_embedding, result)
+        except Exception as e:
+            result = self._generation_error_response(e, query, retrieved_chunks, query_normalized, retrieved_fund_names)
+        
+        yield {"type": "done", **result}
+    
+    def _cached_response(self, query: str, query_embedding=None) -> Optional[Dict]:
+        """
+        Cached response for an identical (normalized) earlier query, or - given the
+        query embedding - for a paraphrase above the cache's similarity threshold
+        """
+        if query_embedding is None:
+            cached = self.response_cache.get_exact(query)
+        else:
+            cached = self.response_cache.get_similar(query_embedding)
+        if cached is None:
+            return None
+        logger.info(f"Serving cached response for query: {query[:50]}...")
+        return dict(cached)
+    
+    def _embed_query(self, query: str, query_embedding: Optional[List[float]]):
+        """Step 1: embed the query (unless precomputed)"""
         logger.info(f"Processing query: {query}")
         logger.info("="*70)
         logger.info("STARTING QUERY PROCESSING - Using Groq LLM + Local Embeddings")
@@ -146,260 +518,273 @@ class RAGPipeline:
         logger.info("Step 1: Generating query embedding (Using local embeddings - no API call)")
         try:
             embedding_start = time.time()
-            query_embedding = self.embedder.generate_query_embedding(query)
+            if query_embedding is None:
+                query_embedding = self.query_batcher.embed(query)
             embedding_time = time.time() - embedding_start
             logger.info(f"✓ Step 1: Query embedding generated successfully (local, no API call, took {embedding_time:.2f}s)")
         except Exception as e:
             logger.error(f"Error generating query embedding: {e}")
             raise
-        
-        # Step 2: Retrieve relevant chunks
+        return query_embedding
+    
+    def _retrieve_chunks(self, query_embedding, top_k: Optional[int]) -> List[Dict]:
+        """Step 2: retrieve the chunks nearest to the query embedding (within the context budget)"""
         retrieved_chunks = self.vector_store.search(
             query_embedding,
-            top_k=config_rag.TOP_K_RETRIEVAL
+            top_k=top_k or config_rag.TOP_K_RETRIEVAL
         )
+        return self._pack_chunks(retrieved_chunks)
+    
+    @staticmethod
+    def _pack_chunks(retrieved_chunks: List[Dict]) -> List[Dict]:
+        """
+        Keep the best chunks (search results are ordered by similarity) until their text
+        exceeds MAX_CONTEXT_TOKENS, estimated at ~4 characters per token.
+        The top chunk is always kept.
+        """
+        budget = config_rag.MAX_CONTEXT_TOKENS * 4
+        used = 0
+        for position, chunk in enumerate(retrieved_chunks):
+            used += len(chunk["text"])
+            if used > budget and position > 0:
+                logger.info(f"Context budget reached: using {position} of {len(retrieved_chunks)} chunks")
+                return retrieved_chunks[:position]
+        return retrieved_chunks
+    
+    @staticmethod
+    def _no_results_response(query: str) -> Dict:
+        """Response when retrieval finds no chunks"""
+        return {
+            "success": False,
+            "answer": "I couldn't find relevant information to answer your query.",
+            "source_urls": [],
+            "query": query,
+            "retrieved_chunks": 0
+        }
+    
+    @staticmethod
+    def _build_messages(prompt: str) -> List[Dict]:
+        """Chat messages for the Groq completion call"""
+        return [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+    
+    def _build_prompt(self, query: str, retrieved_chunks: List[Dict]):
+        """
+        Step 3: build the LLM prompt from the retrieved chunks.
         
-        if not retrieved_chunks:
-            return {
-                "success": False,
-                "answer": "I couldn't find relevant information to answer your query.",
-                "source_urls": [],
-                "query": query
-            }
-        
+        Returns:
+            Tuple of (prompt, normalized query, lowercased fund names of the retrieved chunks)
+        """
         # Step 3: Prepare context for LLM
         context = "\n\n".join([chunk["text"] for chunk in retrieved_chunks])
         
-        # Normalize query for better matching (handle variations like "flexicap" vs "flexi cap")
+        # Normalize query for better matching (handle variations like "flexicap" vs "flexi cap"
+        # and "elss" variations) with a single substitution pass
         query_lower = query.lower()
-        query_normalized = query_lower.replace("flexicap", "flexi cap").replace("flexi-cap", "flexi cap").replace("flexi cap", "flexi cap")
-        
-        # Also normalize "elss" variations
-        query_normalized = query_normalized.replace("elss tax saver", "elss tax saver fund").replace("elss fund", "elss tax saver fund")
-        
-        retrieved_fund_names = [chunk["metadata"].get("fund_name", "").lower() for chunk in retrieved_chunks]
-        
-        # Check if query mentions a fund that might exist but isn't in context
-        from data_storage import DataStorage
-        storage = DataStorage()
-        all_funds_data = storage.load_data()
-        
-        # Normalize to get all fund names
-        all_fund_names = []
-        if isinstance(all_funds_data, list):
-            all_fund_names = [f.get("fund_name", "") for f in all_funds_data]
-        elif isinstance(all_funds_data, dict) and "funds" in all_funds_data:
-            all_fund_names = list(all_funds_data["funds"].keys())
-        elif isinstance(all_funds_data, dict):
-            all_fund_names = list(all_funds_data.keys())
-        
-        # Check if query mentions a fund that exists but isn't in retrieved chunks
-        query_fund_mentioned = None
-        query_lower_words = set(query_lower.split())
-        for fund_name in all_fund_names:
-            fund_words = set(fund_name.lower().split())
-            if len(query_lower_words.intersection(fund_words)) >= 3:  # At least 3 matching words
-                # Check if this fund is in retrieved chunks
-                if not any(fund_name.lower() == chunk["metadata"].get("fund_name", "").lower() 
-                          for chunk in retrieved_chunks):
-                    query_fund_mentioned = fund_name
-                    break
+        query_normalized = _QUERY_VARIANT_RE.sub(lambda match: _QUERY_VARIANTS[match.group(0)], query_lower)
+        
+        retrieved_fund_names = self._chunk_fund_names(retrieved_chunks)
+        
+        # Check if query mentions a fund that exists but isn't in retrieved chunks.
+        # The storage matches names with word bitmaps precomputed by refresh_fund_list/build_index.
+        retrieved_fund_set = set(retrieved_fund_names)
+        query_fund_mentioned = next(
+            (fund_name for fund_name in self.storage.get_funds_sharing_words(query_lower, min_common=3, reload=False)
+             if fund_name.lower() not in retrieved_fund_set),
+            None
+        )
         
         # Step 4: Generate answer using Gemini LLM
         fund_context_note = ""
         if query_fund_mentioned:
             fund_context_note = f"\n\nNOTE: The fund '{query_fund_mentioned}' exists in the database but has no valid data (scraping failed or data unavailable)."
         
-        # Initialize source_urls to avoid UnboundLocalError in exception handler
-        source_urls = []
+        # The static instructions live in the system message (_SYSTEM_PROMPT); only the
+        # context and question are spliced between the constant prefix and suffix
+        prompt = "".join((_PROMPT_PREFIX, context, fund_context_note, _PROMPT_MID, query, _PROMPT_SUFFIX))
+        return prompt, query_normalized, retrieved_fund_names
+    
+    def _extractive_response(self, query: str, retrieved_chunks: List[Dict],
+                             query_normalized: str, retrieved_fund_names: List[str]) -> Optional[Dict]:
+        """
+        Answer single-field lookups ("expense ratio of the flexi cap fund") straight from the
+        retrieved chunks, skipping the LLM call. Returns None - use the LLM - unless the
+        query asks for exactly one field of exactly one stored fund and nothing else, that
+        fund was retrieved, and its chunks hold the requested field.
+        """
+        if not config_rag.EXTRACTIVE_ANSWERS or len(_FIELD_QUERY_RE.findall(query_normalized)) != 1:
+            return None
+        
+        # The stored fund sharing the most distinctive (4+ letter) words with the query;
+        # a tie (e.g. only "parag parikh" given) is ambiguous
+        query_words = set(query_normalized.split())
+        candidates = self.storage.get_funds_sharing_words(query_normalized, min_common=2, reload=False)
+        scores = [len(query_words & _name_words(name.lower(), 3)) for name in candidates]
+        if not scores or scores.count(max(scores)) != 1:
+            return None
+        fund_name = candidates[scores.index(max(scores))]
+        fund_name_lower = fund_name.lower()
+        if fund_name_lower not in retrieved_fund_names:
+            return None
+        
+        # Only the field label, the fund's name and filler words: a compound or "why"
+        # question would get a partial answer (and cache it)
+        other_words = set(_QUERY_WORD_RE.findall(_FIELD_QUERY_RE.sub(" ", query_normalized)))
+        if other_words - _name_words(fund_name_lower) - _FIELD_QUERY_FILLER:
+            return None
+        
+        context_text = "\n\n".join([
+            chunk["text"] for chunk, chunk_fund in zip(retrieved_chunks, retrieved_fund_names)
+            if chunk_fund == fund_name_lower
+        ])
+        answer_parts = self._extract_field_answers(query_normalized, context_text, fund_name)
+        if not answer_parts:
+            return None
+        
+        logger.info("Step 4: Answered from the retrieved chunks (field lookup, no LLM call)")
+        result = self._answer_response(query, " ".join(answer_parts), retrieved_chunks, query_normalized, retrieved_fund_names)
+        result["mode"] = "extractive"
+        return result
+    
+    def _answer_response(self, query: str, answer: str, retrieved_chunks: List[Dict],
+                         query_normalized: str, retrieved_fund_names: List[str]) -> Dict:
+        """Step 5: pick source URLs for a generated answer and build the response dict"""
+        # Extract fund name from query - try to match with retrieved chunks
+        query_fund_name = None
+        query_words = set([w for w in query_normalized.split() if len(w) > 3])
+        
+        # Try to find matching fund in retrieved chunks
+        # Distinct retrieved fund names in retrieval order (the chunks often share a fund)
+        distinct_fund_names = list(dict.fromkeys(retrieved_fund_names))
+        best_match_score = 0
+        for fund_name in distinct_fund_names:
+            # Calculate match score
+            match_score = len(query_words & _name_words(fund_name, 3))
+            if match_score > best_match_score and match_score >= 2:  # Need at least 2 matching words
+                best_match_score = match_score
+                query_fund_name = fund_name
+        
+        # Check if answer mentions a fund name from retrieved chunks (names are lowercased);
+        # each distinct name is searched for once
+        answer_lower = answer.lower()
+        answer_fund_names = [fund_name for fund_name in distinct_fund_names if fund_name in answer_lower]
+        answer_mentions_fund = any(len(fund_name) > 10 for fund_name in answer_fund_names)
+        
+        # Determine if the fund itself is not found (vs. just some data missing)
+        # Check for explicit "fund not found" patterns (_FUND_NOT_FOUND_RE), not just "data not available"
+        
+        # Only consider fund not found if answer explicitly says the fund is missing
+        # AND doesn't mention a specific fund name from our database
+        fund_explicitly_not_found = (
+            _FUND_NOT_FOUND_RE.search(answer_lower) is not None
+            and not answer_mentions_fund
+            and query_fund_name is None
+        )
         
-        prompt = f"""You are a helpful assistant that answers questions about mutual funds based on provided factual information.
-
-IMPORTANT RULES:
-1. Only use information from the provided context
-2. Provide factual answers only - NO investment advice
-3. Always mention the exact fund name from the context in your answer
-4. For returns queries, look for fields like "1 Year Returns", "3 Year Returns", "5 Year Returns", "Returns Since Inception" in the context
-5. If the specific fund mentioned in the question is NOT in the context, explicitly state: "The fund [fund name] is not available in the database. This fund may not exist on Groww, the URL may have changed, or the data could not be scraped successfully. Available funds include: ELSS Tax Saver, Conservative Hybrid, Liquid, Arbitrage, Dynamic Asset Allocation, and Long Term Value funds."
-6. If the information about the fund exists but the specific field is missing, say: "The [field] for [fund name] is not available in the context."
-7. Keep answers concise and factual
-8. Do not make up or infer information not explicitly stated
-9. Do NOT provide source URLs in your answer - they will be added separately
-10. When answering about returns, include the exact percentage values from the context (e.g., "9.49%" or "80.90%")
-
-Context (factual information about mutual funds):
-{context}{fund_context_note}
-
-Question: {query}
-
-Answer the question using only the information from the context above. Be factual and concise. Do not provide investment advice. If the fund is not in the context, clearly state that."""
-
-        try:
-            logger.info(f"Step 4: Generating answer with Groq LLM (Expected: 1 Groq API call)")
-            logger.info(f"[GROQ API] Calling chat.completions.create with prompt length: {len(prompt)} chars")
-            llm_start = time.time()
-            
-            # Use Groq API
-            response = self.groq_client.chat.completions.create(
-                model=self.llm_model_name,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant that answers questions about mutual funds based on provided factual information. Provide factual answers only - NO investment advice."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=config_rag.TEMPERATURE,
-                max_tokens=config_rag.MAX_TOKENS
-            )
-            llm_time = time.time() - llm_start
-            
-            answer = response.choices[0].message.content.strip()
-            total_time = time.time() - query_start_time
-            logger.info(f"[GROQ API] ✓ Success (API call #1, took {llm_time:.2f}s)")
-            logger.info("="*70)
-            logger.info(f"QUERY COMPLETE - Total API calls: 1 (Groq LLM only, embeddings are local), Total time: {total_time:.2f}s")
-            logger.info("="*70)
-            
-            # Extract fund name from query - try to match with retrieved chunks
-            query_fund_name = None
-            query_words = set([w for w in query_normalized.split() if len(w) > 3])
-            
-            # Try to find matching fund in retrieved chunks
-            best_match_score = 0
-            for fund_name in retrieved_fund_names:
-                fund_words = set([w for w in fund_name.split() if len(w) > 3])
-                # Calculate match score
-                match_score = len(query_words.intersection(fund_words))
-                if match_score > best_match_score and match_score >= 2:  # Need at least 2 matching words
-                    best_match_score = match_score
-                    query_fund_name = fund_name
-            
-            # Check if answer mentions a fund name from retrieved chunks
-            answer_lower = answer.lower()
-            answer_mentions_fund = any(
-                fund_name.lower() in answer_lower 
-                for fund_name in retrieved_fund_names 
-                if len(fund_name) > 10
-            )
-            
-            # Determine if the fund itself is not found (vs. just some data missing)
-            # Check for explicit "fund not found" patterns, not just "data not available"
-            # These patterns indicate the fund itself doesn't exist, not just missing data
-            fund_not_found_patterns = [
-                "is not available in the database",
-                "is not in the database",
-                "does not exist",
-                "may not exist",
-                "not found in the database"
-            ]
-            
-            # Only consider fund not found if answer explicitly says the fund is missing
-            # AND doesn't mention a specific fund name from our database
-            fund_explicitly_not_found = (
-                any(pattern in answer_lower for pattern in fund_not_found_patterns) 
-                and not answer_mentions_fund
-                and query_fund_name is None
-            )
-            
-            # Include source URLs if:
-            # 1. We have retrieved chunks (data was found)
-            # 2. Answer mentions a fund name OR we matched a fund from query
-            # 3. Fund is not explicitly marked as not found
-            should_include_source = (
-                len(retrieved_chunks) > 0 
-                and (answer_mentions_fund or query_fund_name is not None)
-                and not fund_explicitly_not_found
-            )
-            
-            if should_include_source:
-                # Determine which fund to use for source URL
-                target_fund_name = None
-                
-                if query_fund_name:
-                    # Use the fund matched from query
-                    target_fund_name = query_fund_name
-                elif answer_mentions_fund:
-                    # Find the fund mentioned in the answer
-                    for fund_name in retrieved_fund_names:
-                        if fund_name.lower() in answer_lower:
-                            target_fund_name = fund_name
-                            break
-                
-                # Get source URLs for the target fund
-                if target_fund_name:
-                    source_urls = list(set([
-                        chunk["metadata"].get("source_url", "") 
-                        for chunk in retrieved_chunks 
-                        if chunk["metadata"].get("fund_name", "").lower() == target_fund_name.lower()
-                        and chunk["metadata"].get("source_url")
-                    ]))
-                else:
-                    # Fallback: use all unique source URLs from retrieved chunks
-                    source_urls = list(set([
-                        chunk["metadata"].get("source_url", "") 
-                        for chunk in retrieved_chunks 
-                        if chunk["metadata"].get("source_url")
-                    ]))
-                
-                # Filter out empty or invalid URLs
-                source_urls = [url for url in source_urls if url and url.strip() and url.startswith("http")]
-                
-                # If no valid URLs found, create a search link to Groww
-                if not source_urls and target_fund_name:
-                    # Create a search URL for the fund on Groww
-                    fund_search_name = target_fund_name.replace(" ", "+")
-                    search_url = f"https://groww.in/mutual-funds?q={fund_search_name}"
-                    source_urls = [search_url]
-                    logger.info(f"No direct URL found, using search URL: {search_url}")
+        # Include source URLs if:
+        # 1. We have retrieved chunks (data was found)
+        # 2. Answer mentions a fund name OR we matched a fund from query
+        # 3. Fund is not explicitly marked as not found
+        should_include_source = (
+            len(retrieved_chunks) > 0 
+            and (answer_mentions_fund or query_fund_name is not None)
+            and not fund_explicitly_not_found
+        )
+        
+        if should_include_source:
+            # Determine which fund to use for source URL
+            target_fund_name = None
+        
+            if query_fund_name:
+                # Use the fund matched from query
+                target_fund_name = query_fund_name
+            elif answer_mentions_fund:
+                # The first retrieved fund mentioned in the answer
+                target_fund_name = answer_fund_names[0]
+        
+            # Get source URLs for the target fund (retrieved_fund_names is parallel to the chunks)
+            retrieved_urls = self._chunk_source_urls(retrieved_chunks)
+            if target_fund_name:
+                source_urls = self._valid_unique_urls(
+                    url for fund_name, url in zip(retrieved_fund_names, retrieved_urls)
+                    if fund_name == target_fund_name
+                )
             else:
-                # Don't include source URLs if fund wasn't found or no chunks retrieved
-                source_urls = []
-            
-            logger.info("Answer generated successfully using Groq LLM")
+                # Fallback: use all unique source URLs from retrieved chunks
+                source_urls = self._valid_unique_urls(retrieved_urls)
+        
+            # If no valid URLs found, create a search link to Groww
+            if not source_urls and target_fund_name:
+                # Create a search URL for the fund on Groww
+                fund_search_name = target_fund_name.replace(" ", "+")
+                search_url = f"https://groww.in/mutual-funds?q={fund_search_name}"
+                source_urls = [search_url]
+                logger.info(f"No direct URL found, using search URL: {search_url}")
+        else:
+            # Don't include source URLs if fund wasn't found or no chunks retrieved
+            source_urls = []
+        
+        logger.info("Answer generated successfully using Groq LLM")
+        return {
+            "success": True,
+            "answer": answer,
+            "source_urls": source_urls,
+            "query": query,
+            "retrieved_chunks": len(retrieved_chunks),
+            "mode": "groq_llm"
+        }
+    
+    def _chunk_source_urls(self, retrieved_chunks: List[Dict]) -> List[str]:
+        """Source URL of each retrieved chunk (parallel to the chunks)"""
+        if SIMPLE_VECTOR_STORE:
+            # Filled by the search from the store's parallel lists
+            return [chunk["source_url"] for chunk in retrieved_chunks]
+        return [chunk["metadata"].get("source_url") for chunk in retrieved_chunks]
+    
+    def _chunk_fund_names(self, retrieved_chunks: List[Dict]) -> List[str]:
+        """Lowercased fund name of each retrieved chunk (parallel to the chunks)"""
+        if SIMPLE_VECTOR_STORE:
+            return [chunk["fund_name_lower"] for chunk in retrieved_chunks]
+        return [chunk["metadata"].get("fund_name", "").lower() for chunk in retrieved_chunks]
+    
+    @staticmethod
+    def _valid_unique_urls(urls) -> List[str]:
+        """http(s) URLs without duplicates, in first-seen order"""
+        return list(dict.fromkeys(url for url in urls if url and url.startswith("http")))
+    
+    def _generation_error_response(self, e: Exception, query: str, retrieved_chunks: List[Dict],
+                                   query_normalized: str, retrieved_fund_names: List[str]) -> Dict:
+        """Response when the LLM call fails: fallback extraction on quota errors, else an error"""
+        source_urls = []
+        error_str = str(e).lower()
+        is_quota_error = "quota" in error_str or "429" in error_str or "limit" in error_str
+        
+        if is_quota_error and retrieved_chunks:
+            logger.warning("Gemini API quota exceeded. Using fallback extraction from retrieved chunks.")
+            # Fallback: Extract information directly from chunks
+            answer = self._extract_answer_from_chunks(query, retrieved_chunks, query_normalized, retrieved_fund_names)
+        
+            # Get source URLs from retrieved chunks
+            source_urls = self._valid_unique_urls(self._chunk_source_urls(retrieved_chunks))
+        
+            logger.info("Using fallback extraction method (Groq API quota/error occurred)")
             return {
                 "success": True,
                 "answer": answer,
                 "source_urls": source_urls,
                 "query": query,
                 "retrieved_chunks": len(retrieved_chunks),
-                "mode": "groq_llm"
+                "note": "Answer extracted directly from data (LLM quota/error occurred)",
+                "mode": "fallback_extraction"
+            }
+        else:
+            logger.error(f"Error generating answer: {e}")
+            return {
+                "success": False,
+                "answer": f"Error generating answer: {str(e)}",
+                "source_urls": source_urls,
+                "query": query,
+                "retrieved_chunks": 0
             }
-            
-        except Exception as e:
-            error_str = str(e).lower()
-            is_quota_error = "quota" in error_str or "429" in error_str or "limit" in error_str
-            
-            if is_quota_error and retrieved_chunks:
-                logger.warning("Gemini API quota exceeded. Using fallback extraction from retrieved chunks.")
-                # Fallback: Extract information directly from chunks
-                answer = self._extract_answer_from_chunks(query, retrieved_chunks, query_normalized, retrieved_fund_names)
-                
-                # Get source URLs from retrieved chunks
-                source_urls = list(set([
-                    chunk["metadata"].get("source_url", "") 
-                    for chunk in retrieved_chunks 
-                    if chunk["metadata"].get("source_url")
-                ]))
-                
-                # Filter out empty or invalid URLs
-                source_urls = [url for url in source_urls if url and url.strip() and url.startswith("http")]
-                
-                logger.info("Using fallback extraction method (Groq API quota/error occurred)")
-                return {
-                    "success": True,
-                    "answer": answer,
-                    "source_urls": source_urls,
-                    "query": query,
-                    "retrieved_chunks": len(retrieved_chunks),
-                    "note": "Answer extracted directly from data (LLM quota/error occurred)",
-                    "mode": "fallback_extraction"
-                }
-            else:
-                logger.error(f"Error generating answer: {e}")
-                return {
-                    "success": False,
-                    "answer": f"Error generating answer: {str(e)}",
-                    "source_urls": source_urls,
-                    "query": query
-                }
     
     def _extract_answer_from_chunks(self, query: str, chunks: List[Dict], query_normalized: str, fund_names: List[str]) -> str:
         """
@@ -411,111 +796,13 @@ Answer the question using only the information from the context above. Be factua
         
         # Try to identify the fund name from query
         fund_name = None
+        query_words = set(query_lower.split())
         for name in fund_names:
-            name_words = set(name.split())
-            query_words = set(query_lower.split())
-            if len(name_words.intersection(query_words)) >= 2:
+            if len(_name_words(name) & query_words) >= 2:
                 fund_name = name
                 break
         
-        # Extract common fields
-        answer_parts = []
-        
-        # Check for specific field queries
-        if "exit load" in query_lower or "exitload" in query_lower:
-            # Look for exit load in context
-            exit_load_patterns = [
-                r'exit load[:\s]+([^\n]+)',
-                r'exitload[:\s]+([^\n]+)',
-                r'Exit Load[:\s]+([^\n]+)',
-            ]
-            for pattern in exit_load_patterns:
-                match = re.search(pattern, context_text, re.IGNORECASE)
-                if match:
-                    exit_load = match.group(1).strip()
-                    if fund_name:
-                        answer_parts.append(f"The exit load for {fund_name} is {exit_load}.")
-                    else:
-                        answer_parts.append(f"Exit load: {exit_load}")
-                    break
-        
-        if "expense ratio" in query_lower or "expenseratio" in query_lower:
-            expense_patterns = [
-                r'expense ratio[:\s]+([^\n]+)',
-                r'Expense Ratio[:\s]+([^\n]+)',
-                r'Total Expense Ratio[:\s]+([^\n]+)',
-            ]
-            for pattern in expense_patterns:
-                match = re.search(pattern, context_text, re.IGNORECASE)
-                if match:
-                    expense = match.group(1).strip()
-                    if fund_name:
-                        answer_parts.append(f"The expense ratio for {fund_name} is {expense}.")
-                    else:
-                        answer_parts.append(f"Expense ratio: {expense}")
-                    break
-        
-        if "minimum sip" in query_lower or "min sip" in query_lower or "minimum investment" in query_lower:
-            sip_patterns = [
-                r'minimum sip[:\s]+([^\n]+)',
-                r'Minimum SIP[:\s]+([^\n]+)',
-                r'minimum investment[:\s]+([^\n]+)',
-            ]
-            for pattern in sip_patterns:
-                match = re.search(pattern, context_text, re.IGNORECASE)
-                if match:
-                    sip = match.group(1).strip()
-                    if fund_name:
-                        answer_parts.append(f"The minimum SIP for {fund_name} is {sip}.")
-                    else:
-                        answer_parts.append(f"Minimum SIP: {sip}")
-                    break
-        
-        if "lock" in query_lower and "in" in query_lower:
-            lock_patterns = [
-                r'lock[-\s]?in[:\s]+([^\n]+)',
-                r'Lock[-\s]?in[:\s]+([^\n]+)',
-            ]
-            for pattern in lock_patterns:
-                match = re.search(pattern, context_text, re.IGNORECASE)
-                if match:
-                    lock_in = match.group(1).strip()
-                    if fund_name:
-                        answer_parts.append(f"The lock-in period for {fund_name} is {lock_in}.")
-                    else:
-                        answer_parts.append(f"Lock-in period: {lock_in}")
-                    break
-        
-        if "riskometer" in query_lower or "risk" in query_lower:
-            risk_patterns = [
-                r'riskometer[:\s]+([^\n]+)',
-                r'Riskometer[:\s]+([^\n]+)',
-                r'risk level[:\s]+([^\n]+)',
-            ]
-            for pattern in risk_patterns:
-                match = re.search(pattern, context_text, re.IGNORECASE)
-                if match:
-                    risk = match.group(1).strip()
-                    if fund_name:
-                        answer_parts.append(f"The riskometer for {fund_name} is {risk}.")
-                    else:
-                        answer_parts.append(f"Riskometer: {risk}")
-                    break
-        
-        if "benchmark" in query_lower:
-            benchmark_patterns = [
-                r'benchmark[:\s]+([^\n]+)',
-                r'Benchmark[:\s]+([^\n]+)',
-            ]
-            for pattern in benchmark_patterns:
-                match = re.search(pattern, context_text, re.IGNORECASE)
-                if match:
-                    benchmark = match.group(1).strip()
-                    if fund_name:
-                        answer_parts.append(f"The benchmark for {fund_name} is {benchmark}.")
-                    else:
-                        answer_parts.append(f"Benchmark: {benchmark}")
-                    break
+        answer_parts = self._extract_field_answers(query_lower, context_text, fund_name)
         
         # If we found specific information, return it
         if answer_parts:
@@ -541,6 +828,76 @@ Answer the question using only the information from the context above. Be factua
         
         return "I found relevant information in the database, but I'm unable to generate a detailed answer due to API quota limits. Please try again later or check the source URLs for direct information."
     
+    @staticmethod
+    def _extract_field_answers(query_lower: str, context_text: str, fund_name: Optional[str]) -> List[str]:
+        """One answer sentence per field the query asks about and the context contains"""
+        # Extract common fields: first value of each label, from one scan of the context
+        field_values = {}
+        for match in _FIELD_RE.finditer(context_text):
+            label = match.group("key").lower()
+            if label.startswith("lock"):
+                label = "lock-in"
+            field_values.setdefault(label, match.group("val").strip())
+        
+        def first_value(*labels):
+            """Value of the first label (in order of preference) present in the context"""
+            return next((field_values[label] for label in labels if label in field_values), None)
+        
+        answer_parts = []
+        
+        # Check for specific field queries
+        if "exit load" in query_lower or "exitload" in query_lower:
+            # Look for exit load in context
+            exit_load = first_value("exit load", "exitload")
+            if exit_load is not None:
+                if fund_name:
+                    answer_parts.append(f"The exit load for {fund_name} is {exit_load}.")
+                else:
+                    answer_parts.append(f"Exit load: {exit_load}")
+        
+        if "expense ratio" in query_lower or "expenseratio" in query_lower:
+            # Also covers "Total Expense Ratio"
+            expense = first_value("expense ratio")
+            if expense is not None:
+                if fund_name:
+                    answer_parts.append(f"The expense ratio for {fund_name} is {expense}.")
+                else:
+                    answer_parts.append(f"Expense ratio: {expense}")
+        
+        if "minimum sip" in query_lower or "min sip" in query_lower or "minimum investment" in query_lower:
+            sip = first_value("minimum sip", "minimum investment")
+            if sip is not None:
+                if fund_name:
+                    answer_parts.append(f"The minimum SIP for {fund_name} is {sip}.")
+                else:
+                    answer_parts.append(f"Minimum SIP: {sip}")
+        
+        if "lock" in query_lower and "in" in query_lower:
+            lock_in = first_value("lock-in")
+            if lock_in is not None:
+                if fund_name:
+                    answer_parts.append(f"The lock-in period for {fund_name} is {lock_in}.")
+                else:
+                    answer_parts.append(f"Lock-in period: {lock_in}")
+        
+        if "riskometer" in query_lower or "risk" in query_lower:
+            risk = first_value("riskometer", "risk level")
+            if risk is not None:
+                if fund_name:
+                    answer_parts.append(f"The riskometer for {fund_name} is {risk}.")
+                else:
+                    answer_parts.append(f"Riskometer: {risk}")
+        
+        if "benchmark" in query_lower:
+            benchmark = first_value("benchmark")
+            if benchmark is not None:
+                if fund_name:
+                    answer_parts.append(f"The benchmark for {fund_name} is {benchmark}.")
+                else:
+                    answer_parts.append(f"Benchmark: {benchmark}")
+        
+        return answer_parts
+    
     def format_answer(self, response: Dict) -> str:
         """Format the response with source URLs"""
         answer = response.get("answer", "")
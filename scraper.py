@@ -2,6 +2,7 @@
 Web scraper for extracting mutual fund data from Groww website
 """
 
+import re
 import time
 import logging
 import requests
@@ -23,6 +24,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Page-text patterns of the fallback extractors, compiled once at import
+_SCRIPT_JSON_RE = re.compile(r'\{.*"expense_ratio".*\}', re.DOTALL)
+_EXPENSE_RATIO_RE = re.compile(r'expense\s+ratio[:\s]+([0-9.]+%)', re.IGNORECASE)
+_EXIT_LOAD_RE = re.compile(r'exit\s+load[:\s]+(nil|n/a|na|[0-9.]+%)', re.IGNORECASE)
+_MINIMUM_SIP_RE = re.compile(r'minimum\s+sip[:\s]+(?:₹|rs\.?|inr\s*)?([0-9,]+)', re.IGNORECASE)
+_LOCK_IN_RE = re.compile(r'lock[-\s]?in[:\s]+(?:n/a|na|nil|([0-9]+)\s*(?:y|yr|years?))', re.IGNORECASE)
+_RISKOMETER_RE = re.compile(r'riskometer[:\s]+([a-z\s]+risk)', re.IGNORECASE)
+_BENCHMARK_RE = re.compile(r'benchmark[:\s]+([a-z0-9\s]+index)', re.IGNORECASE)
+
+# Risk levels found in page text, in order of specificity
+_RISK_LEVEL_RES = [
+    (re.compile(pattern, re.IGNORECASE), risk_text) for pattern, risk_text in (
+        (r'(very\s+high\s+risk)', 'Very High Risk'),
+        (r'(moderately\s+high\s+risk)', 'Moderately High Risk'),
+        (r'(high\s+risk)', 'High Risk'),
+        (r'(moderate\s+risk)', 'Moderate Risk'),
+        (r'(low\s+to\s+moderate\s+risk)', 'Low to Moderate Risk'),
+        (r'(low\s+risk)', 'Low Risk'),
+    )
+]
+
 
 class GrowwMFScraper:
     """Scraper for Groww mutual fund detail pages"""
@@ -138,7 +160,6 @@ class GrowwMFScraper:
     def _extract_json_from_script(self, soup: BeautifulSoup) -> Optional[Dict]:
         """Extract JSON data from script tags"""
         import json
-        import re
         
         # Look for script tags with JSON data (Next.js __NEXT_DATA__ pattern)
         scripts = soup.find_all('script', id='__NEXT_DATA__')
@@ -159,7 +180,7 @@ class GrowwMFScraper:
             if script.string and ('expense_ratio' in script.string or 'mf' in script.string.lower()):
                 try:
                     # Try to extract JSON object from script content
-                    json_match = re.search(r'\{.*"expense_ratio".*\}', script.string, re.DOTALL)
+                    json_match = _SCRIPT_JSON_RE.search(script.string)
                     if json_match:
                         json_obj = json.loads(json_match.group(0))
                         return json_obj
@@ -600,34 +621,29 @@ class GrowwMFScraper:
     
     def _extract_from_text_patterns(self, soup: BeautifulSoup, data: Dict) -> Dict:
         """Extract data using regex patterns on page text"""
-        import re
         page_text = soup.get_text()
         
         # Expense Ratio pattern
         if not data["expense_ratio"]:
-            pattern = r'expense\s+ratio[:\s]+([0-9.]+%)'
-            match = re.search(pattern, page_text, re.IGNORECASE)
+            match = _EXPENSE_RATIO_RE.search(page_text)
             if match:
                 data["expense_ratio"] = match.group(1)
         
         # Exit Load pattern
         if not data["exit_load"]:
-            pattern = r'exit\s+load[:\s]+(nil|n/a|na|[0-9.]+%)'
-            match = re.search(pattern, page_text, re.IGNORECASE)
+            match = _EXIT_LOAD_RE.search(page_text)
             if match:
                 data["exit_load"] = match.group(1).capitalize() if match.group(1).lower() in ['nil', 'n/a', 'na'] else match.group(1)
         
         # Minimum SIP pattern
         if not data["minimum_sip"]:
-            pattern = r'minimum\s+sip[:\s]+(?:₹|rs\.?|inr\s*)?([0-9,]+)'
-            match = re.search(pattern, page_text, re.IGNORECASE)
+            match = _MINIMUM_SIP_RE.search(page_text)
             if match:
                 data["minimum_sip"] = f"₹{match.group(1)}"
         
         # Lock-in pattern
         if not data["lock_in"]:
-            pattern = r'lock[-\s]?in[:\s]+(?:n/a|na|nil|([0-9]+)\s*(?:y|yr|years?))'
-            match = re.search(pattern, page_text, re.IGNORECASE)
+            match = _LOCK_IN_RE.search(page_text)
             if match:
                 if match.group(1):
                     data["lock_in"] = f"{match.group(1)}Y"
@@ -636,8 +652,7 @@ class GrowwMFScraper:
         
         # Riskometer pattern
         if not data["riskometer"]:
-            pattern = r'riskometer[:\s]+([a-z\s]+risk)'
-            match = re.search(pattern, page_text, re.IGNORECASE)
+            match = _RISKOMETER_RE.search(page_text)
             if match:
                 data["riskometer"] = match.group(1).strip().title()
         
@@ -645,21 +660,11 @@ class GrowwMFScraper:
     
     def _extract_riskometer_from_text(self, soup: BeautifulSoup, data: Dict) -> Dict:
         """Extract riskometer from page text as fallback"""
-        import re
         page_text = soup.get_text()
         
-        # Common risk patterns in order of specificity
-        risk_patterns = [
-            (r'(very\s+high\s+risk)', 'Very High Risk'),
-            (r'(moderately\s+high\s+risk)', 'Moderately High Risk'),
-            (r'(high\s+risk)', 'High Risk'),
-            (r'(moderate\s+risk)', 'Moderate Risk'),
-            (r'(low\s+to\s+moderate\s+risk)', 'Low to Moderate Risk'),
-            (r'(low\s+risk)', 'Low Risk'),
-        ]
-        
-        for pattern, risk_text in risk_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        # Common risk patterns in order of specificity (_RISK_LEVEL_RES)
+        for pattern, risk_text in _RISK_LEVEL_RES:
+            match = pattern.search(page_text)
             if match:
                 data["riskometer"] = risk_text
                 logger.info(f"Extracted riskometer from page text: {risk_text}")
@@ -667,8 +672,7 @@ class GrowwMFScraper:
         
         # Benchmark pattern
         if not data["benchmark"]:
-            pattern = r'benchmark[:\s]+([a-z0-9\s]+index)'
-            match = re.search(pattern, page_text, re.IGNORECASE)
+            match = _BENCHMARK_RE.search(page_text)
             if match:
                 data["benchmark"] = match.group(1).strip()
         
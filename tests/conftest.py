@@ -0,0 +1,84 @@
+"""
+Shared fixtures: a RAGPipeline over the bundled fund data, with a small deterministic
+embedder and a fake Groq client standing in for the model download and the API
+"""
+
+import hashlib
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import config_rag  # noqa: E402
+import rag_pipeline  # noqa: E402
+from data_chunking import FundDataChunker  # noqa: E402
+from data_storage import DataStorage  # noqa: E402
+from embedding_batcher import QueryEmbeddingBatcher  # noqa: E402
+from query_cache import QueryResponseCache  # noqa: E402
+
+EMBEDDING_DIM = 64
+
+
+class HashingEmbedder:
+    """Bag-of-words vectors (hashed word counts), unit-norm like the real embedders"""
+
+    def generate_embeddings_batch(self, texts):
+        matrix = np.zeros((len(texts), EMBEDDING_DIM), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                digest = hashlib.blake2b(word.encode(), digest_size=4).digest()
+                matrix[row, int.from_bytes(digest, "little") % EMBEDDING_DIM] += 1.0
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix.tolist()
+
+    def generate_query_embedding(self, text):
+        return self.generate_embeddings_batch([text])[0]
+
+
+class FakeGroq:
+    """Records the process that created it and the prompts it was sent"""
+
+    def __init__(self, api_key=None, http_client=None):
+        self.pid = os.getpid()
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, messages, stream=False, **kwargs):
+        self.calls.append(messages)
+        message = SimpleNamespace(content="Generated answer.")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """RAGPipeline indexed from data/storage into a temporary vector store"""
+    monkeypatch.setattr(rag_pipeline, "Groq", FakeGroq, raising=False)
+    monkeypatch.setattr(config_rag, "EXTRACTIVE_ANSWERS", True)
+    monkeypatch.setattr(config_rag, "VECTOR_DB_PATH", str(tmp_path / "vector_db"))
+    monkeypatch.setattr(config_rag, "VECTOR_STORE_BACKEND", "numpy")
+    monkeypatch.setattr(config_rag, "VECTOR_STORE_PRECISION", "float32")
+
+    pipeline = object.__new__(rag_pipeline.RAGPipeline)
+    pipeline.storage = DataStorage(os.path.join(REPO_DIR, "data", "storage"))
+    pipeline.chunker = FundDataChunker(
+        chunk_size=config_rag.CHUNK_SIZE, chunk_overlap=config_rag.CHUNK_OVERLAP
+    )
+    pipeline.embedder = HashingEmbedder()
+    pipeline.query_batcher = QueryEmbeddingBatcher(pipeline.embedder.generate_embeddings_batch)
+    pipeline.vector_store = pipeline._create_vector_store()
+    pipeline._groq_api_key = "test-key"
+    pipeline._http_client = None
+    pipeline._groq_client = FakeGroq()
+    pipeline._groq_client_pid = os.getpid()
+    pipeline.llm_model_name = "test-model"
+    pipeline._completion_kwargs = {"model": "test-model"}
+    pipeline.response_cache = QueryResponseCache()
+    pipeline.refresh_fund_list()
+    pipeline.build_index()
+    return pipeline
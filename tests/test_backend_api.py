@@ -0,0 +1,29 @@
+"""
+Flask routes of backend_rag_api (no RAG pipeline is built)
+"""
+
+import os
+
+os.environ.setdefault("RAG_PREWARM", "0")
+
+import backend_rag_api  # noqa: E402
+
+
+def test_concurrent_init_is_rejected():
+    client = backend_rag_api.app.test_client()
+    with backend_rag_api._init_lock:
+        response = client.post("/init")
+    assert response.status_code == 409
+    assert response.get_json()["success"] is False
+
+
+def test_cache_clear_requires_admin_token(monkeypatch):
+    client = backend_rag_api.app.test_client()
+    monkeypatch.delenv("ADMIN_TOKEN", raising=False)
+    assert client.post("/admin/cache/clear").status_code == 403
+    assert client.post("/admin/cache/clear", headers={"Authorization": "Bearer "}).status_code == 403
+
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    assert client.post("/admin/cache/clear").status_code == 403
+    assert client.post("/admin/cache/clear", headers={"Authorization": "Bearer wrong"}).status_code == 403
+    assert client.post("/admin/cache/clear", headers={"Authorization": "Bearer secret"}).status_code == 200
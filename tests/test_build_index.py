@@ -0,0 +1,47 @@
+"""
+Index rebuilds must not disturb queries running against the current index
+"""
+
+import rag_pipeline
+
+
+def test_rebuild_swaps_in_a_new_store(pipeline):
+    old_store = pipeline.vector_store
+    old_count = old_store.get_collection_count()
+    assert old_count > 0
+
+    assert pipeline.build_index() == old_count
+    assert pipeline.vector_store is not old_store
+    assert pipeline.vector_store.get_collection_count() == old_count
+    # The replaced store still answers queries that already hold it
+    assert old_store.get_collection_count() == old_count
+    assert len(old_store.search(pipeline.embedder.generate_query_embedding("expense ratio"), top_k=3)) == 3
+
+
+def test_queries_during_rebuild_see_the_old_index(pipeline):
+    embed_batch = pipeline.embedder.generate_embeddings_batch
+    seen = []
+
+    def embed_and_query(texts):
+        # Runs while build_index is embedding the new chunks
+        chunks = pipeline._retrieve_chunks(embed_batch(["Parag Parikh Flexi Cap expense ratio"])[0], None)
+        seen.append((len(chunks), pipeline._chunk_fund_names(chunks), pipeline._chunk_source_urls(chunks)))
+        return embed_batch(texts)
+
+    pipeline.embedder.generate_embeddings_batch = embed_and_query
+    pipeline.build_index()
+
+    assert seen
+    for count, fund_names, source_urls in seen:
+        assert count > 0
+        assert len(fund_names) == len(source_urls) == count
+        assert all(fund_names)
+        assert all(url.startswith("http") for url in source_urls)
+
+
+def test_search_results_carry_their_lookup_fields(pipeline):
+    assert rag_pipeline.SIMPLE_VECTOR_STORE
+    query_embedding = pipeline.embedder.generate_query_embedding("exit load")
+    for chunk in pipeline.vector_store.search(query_embedding, top_k=5):
+        assert chunk["fund_name_lower"] == chunk["metadata"]["fund_name"].lower()
+        assert chunk["source_url"] == chunk["metadata"]["source_url"]
@@ -0,0 +1,26 @@
+"""
+Fund data storage
+"""
+
+import json
+import os
+
+from data_storage import DataStorage
+
+STORAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "storage")
+
+
+def test_load_data_returns_a_top_level_copy():
+    storage = DataStorage(STORAGE_DIR)
+    data = storage.load_data()
+    assert type(data) is dict
+    json.dumps(data)
+
+    # Replacing top-level keys doesn't reach the cache
+    fund_count = len(data["funds"])
+    data["funds"] = {}
+    data["extra"] = True
+    reloaded = storage.load_data()
+    assert len(reloaded["funds"]) == fund_count
+    assert "extra" not in reloaded
+    assert reloaded is not data
@@ -0,0 +1,56 @@
+"""
+Micro-batched query embeddings
+"""
+
+import threading
+
+from embedding_batcher import QueryEmbeddingBatcher
+
+
+def test_concurrent_queries_share_a_batch():
+    calls = []
+
+    def embed_batch(texts):
+        calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    batcher = QueryEmbeddingBatcher(embed_batch, max_wait_seconds=0.2)
+    results = {}
+    threads = [
+        threading.Thread(target=lambda q=q: results.__setitem__(q, batcher.embed(q)))
+        for q in ("a", "bb", "ccc")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {"a": [1.0], "bb": [2.0], "ccc": [3.0]}
+    assert sum(len(texts) for texts in calls) == 3
+
+
+def test_timeout_falls_back_to_a_direct_call():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def embed_batch(texts):
+        calls.append((threading.current_thread().name, list(texts)))
+        if threading.current_thread().name == "query-embed-batcher":
+            started.set()
+            release.wait(5)
+        return [[1.0] for _ in texts]
+
+    batcher = QueryEmbeddingBatcher(embed_batch, max_wait_seconds=0)
+    # The first query occupies the worker; the second times out waiting behind it
+    first = threading.Thread(target=batcher.embed, args=("slow",))
+    first.start()
+    assert started.wait(5)
+    assert batcher.embed("fast", timeout=0.05) == [1.0]
+    assert calls[-1] == (threading.current_thread().name, ["fast"])
+
+    release.set()
+    first.join()
+    # The timed-out query is not embedded a second time by the worker
+    assert batcher.embed("next") == [1.0]
+    assert [texts for _, texts in calls].count(["fast"]) == 1
@@ -0,0 +1,32 @@
+"""
+Persistent embedding cache
+"""
+
+import numpy as np
+
+from embedding_cache import CachingEmbedder, EmbeddingCache
+
+
+class CountingEmbedder:
+    def __init__(self):
+        self.calls = []
+
+    def generate_embeddings_batch(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        if not texts:
+            return np.empty((0, 2), dtype=np.float32)
+        return np.array([[float(len(text)), 1.0] for text in texts], dtype=np.float32)
+
+
+def test_empty_batch_matches_the_wrapped_embedder(tmp_path):
+    embedder = CachingEmbedder(CountingEmbedder(), EmbeddingCache(str(tmp_path / "cache.sqlite3"), model="test"))
+    assert embedder.generate_embeddings_batch([]).shape == (0, 2)
+
+
+def test_cached_texts_are_not_embedded_again(tmp_path):
+    inner = CountingEmbedder()
+    embedder = CachingEmbedder(inner, EmbeddingCache(str(tmp_path / "cache.sqlite3"), model="test"))
+    embedder.generate_embeddings_batch(["a", "bb"])
+    result = embedder.generate_embeddings_batch(["bb", "ccc", "a"])
+    np.testing.assert_array_equal(result[:, 0], [2.0, 3.0, 1.0])
+    assert inner.calls == [["a", "bb"], ["ccc"]]
@@ -0,0 +1,38 @@
+"""
+Field lookups answered from the retrieved chunks without the LLM
+"""
+
+
+def _answer(pipeline, query):
+    pipeline.groq_client.calls.clear()
+    result = pipeline.answer_query(query)
+    assert result["success"]
+    return result, len(pipeline.groq_client.calls)
+
+
+def test_single_field_lookup_skips_the_llm(pipeline):
+    result, llm_calls = _answer(pipeline, "What is the expense ratio of Parag Parikh Flexi Cap Fund?")
+    assert llm_calls == 0
+    assert result["mode"] == "extractive"
+    assert "0.63%" in result["answer"]
+
+
+def test_compound_query_uses_the_llm(pipeline):
+    query = "What is the expense ratio and 3-year return of Parag Parikh Flexi Cap Fund?"
+    result, llm_calls = _answer(pipeline, query)
+    assert llm_calls == 1
+    assert result.get("mode") != "extractive"
+    # The cached response is the generated one too
+    assert pipeline.answer_query(query).get("mode") != "extractive"
+
+
+def test_two_fields_use_the_llm(pipeline):
+    result, llm_calls = _answer(pipeline, "expense ratio and exit load of Parag Parikh Flexi Cap Fund")
+    assert llm_calls == 1
+    assert result.get("mode") != "extractive"
+
+
+def test_why_query_uses_the_llm(pipeline):
+    result, llm_calls = _answer(pipeline, "Why is the expense ratio of Parag Parikh Flexi Cap Fund so low?")
+    assert llm_calls == 1
+    assert result.get("mode") != "extractive"
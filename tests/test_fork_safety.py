@@ -0,0 +1,94 @@
+"""
+Process-local resources built before a fork (gunicorn preload_app + RAG_EAGER_INIT)
+must be recreated in the forked worker
+"""
+
+import io
+import json
+import logging
+import os
+
+import pytest
+
+os.environ.setdefault("RAG_PREWARM", "0")
+
+import backend_rag_api  # noqa: E402
+from embedding_cache import EmbeddingCache  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+
+def _run_in_child(fn):
+    """Run fn() in a forked child and return its JSON-serializable result"""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        status = 0
+        try:
+            payload = {"result": fn()}
+        except BaseException as e:
+            payload = {"error": repr(e)}
+            status = 1
+        with os.fdopen(write_fd, "w") as f:
+            json.dump(payload, f)
+        os._exit(status)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        payload = json.load(f)
+    os.waitpid(pid, 0)
+    assert "error" not in payload, payload.get("error")
+    return payload["result"]
+
+
+def test_query_in_forked_child(pipeline):
+    # The parent answers first, starting the batcher thread and creating its Groq client
+    parent = pipeline.answer_query("Tell me about the Parag Parikh Flexi Cap Fund")
+    assert parent["success"]
+
+    def child_query():
+        result = pipeline.answer_query("How has the HDFC ELSS fund performed?")
+        return {
+            "success": result["success"],
+            "answer": result["answer"],
+            "groq_pid": pipeline.groq_client.pid,
+            "pid": os.getpid(),
+        }
+
+    child = _run_in_child(child_query)
+    assert child["success"]
+    assert child["answer"]
+    assert child["groq_pid"] == child["pid"]
+
+
+def test_embedding_cache_in_forked_child(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"), model="test")
+    cache.put_many(["parent text"], [[1.0, 0.0]])
+
+    def child_cache():
+        cache.put_many(["child text"], [[0.0, 1.0]])
+        return [vec.tolist() for vec in cache.get_many(["parent text", "child text"])]
+
+    assert _run_in_child(child_cache) == [[1.0, 0.0], [0.0, 1.0]]
+    assert cache.get_many(["child text"])[0].tolist() == [0.0, 1.0]
+
+
+def test_log_listener_in_forked_child():
+    parent_listener = backend_rag_api._log_listener
+
+    def child_log():
+        listener = backend_rag_api._log_listener
+        stream = io.StringIO()
+        backend_rag_api._log_stream_handler.setStream(stream)
+        # Other modules may have configured the root logger first - use the API's handler
+        logger = logging.getLogger("fork-test")
+        logger.addHandler(backend_rag_api._log_queue_handler)
+        logger.propagate = False
+        logger.warning("logged from the child")
+        listener.stop()  # drains the queue
+        return {"new_listener": listener is not parent_listener, "output": stream.getvalue()}
+
+    child = _run_in_child(child_log)
+    assert child["new_listener"]
+    assert "logged from the child" in child["output"]
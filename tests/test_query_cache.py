@@ -0,0 +1,64 @@
+"""
+Persistence of the response cache
+"""
+
+import json
+
+import numpy as np
+
+from query_cache import QueryResponseCache
+
+
+def _unit(*values):
+    vec = np.array(values, dtype=np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "responses.json")
+    cache = QueryResponseCache()
+    cache.put("What is the exit load?", _unit(1, 0, 0), {"answer": "1%", "source_urls": ["https://a"]})
+    cache.save(path)
+
+    # Plain JSON plus a plain .npy array - nothing is unpickled on load
+    with open(path) as f:
+        assert json.load(f)["exact"][0][0] == "what is the exit load?"
+    assert np.load(tmp_path / "responses.npy").shape == (1, 3)
+
+    restored = QueryResponseCache()
+    restored.load(path)
+    assert restored.get_exact("what is the EXIT load?") == {"answer": "1%", "source_urls": ["https://a"]}
+    assert restored.get_similar(_unit(1, 0.01, 0)) == {"answer": "1%", "source_urls": ["https://a"]}
+
+
+def test_saves_from_several_workers_are_merged(tmp_path):
+    path = str(tmp_path / "responses.json")
+    first = QueryResponseCache()
+    first.put("query one", _unit(1, 0, 0), {"answer": "one"})
+    second = QueryResponseCache()
+    second.put("query two", _unit(0, 1, 0), {"answer": "two"})
+
+    first.save(path)
+    second.save(path)
+    # A worker that loaded the file saves again without duplicating entries
+    third = QueryResponseCache()
+    third.load(path)
+    third.save(path)
+
+    restored = QueryResponseCache()
+    restored.load(path)
+    assert restored.get_exact("query one") == {"answer": "one"}
+    assert restored.get_exact("query two") == {"answer": "two"}
+    assert restored.get_similar(_unit(1, 0, 0)) == {"answer": "one"}
+    assert np.load(tmp_path / "responses.npy").shape == (2, 3)
+
+
+def test_expired_entries_are_not_saved(tmp_path):
+    path = str(tmp_path / "responses.json")
+    cache = QueryResponseCache(ttl_seconds=-1)
+    cache.put("old query", _unit(1, 0, 0), {"answer": "old"})
+    cache.save(path)
+
+    restored = QueryResponseCache()
+    restored.load(path)
+    assert restored.get_exact("old query") is None
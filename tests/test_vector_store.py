@@ -0,0 +1,67 @@
+"""
+Persistence of the numpy vector store
+"""
+
+import json
+
+import numpy as np
+
+from vector_store_simple import SimpleVectorStore
+
+
+def _store_with_chunks(db_path):
+    store = SimpleVectorStore(db_path=db_path)
+    chunks = [{"text": f"chunk {i}", "metadata": {"fund_name": "Fund", "source_url": "https://x"}} for i in range(3)]
+    store.add_chunks(chunks, np.eye(3, 4, dtype=np.float32).tolist())
+    return store
+
+
+def test_matrix_file_is_memory_mapped(tmp_path):
+    saved = _store_with_chunks(str(tmp_path))
+    # The JSON file holds the chunks and the matrix shape, not the embeddings
+    with open(tmp_path / "mutual_funds.json") as f:
+        data = json.load(f)
+    assert "embeddings" not in data
+    assert (data["matrix"]["rows"], data["matrix"]["dim"]) == (3, 4)
+
+    loaded = SimpleVectorStore(db_path=str(tmp_path))
+    assert isinstance(loaded.embeddings, np.memmap)
+    np.testing.assert_array_equal(loaded.embeddings, saved.embeddings)
+    assert loaded.chunks == saved.chunks
+
+
+def test_mismatched_matrix_file_is_not_used(tmp_path):
+    _store_with_chunks(str(tmp_path))
+    # Same file name, different shape (e.g. truncated or left over from another build)
+    (matrix_path,) = tmp_path.glob("mutual_funds.*.npy")
+    np.save(matrix_path, np.ones((2, 4), dtype=np.float32))
+
+    loaded = SimpleVectorStore(db_path=str(tmp_path))
+    assert loaded.get_collection_count() == 0
+    assert len(loaded.embeddings) == 0
+
+
+def test_each_save_writes_a_new_matrix_file(tmp_path):
+    store = _store_with_chunks(str(tmp_path))
+    (first,) = tmp_path.glob("mutual_funds.*.npy")
+    store.add_chunks([{"text": "chunk 3", "metadata": {}}], [[0.0, 0.0, 0.0, 1.0]])
+    (second,) = tmp_path.glob("mutual_funds.*.npy")
+    assert second != first
+
+    loaded = SimpleVectorStore(db_path=str(tmp_path))
+    assert loaded.embeddings.shape == (4, 4)
+    loaded.clear_collection()
+    assert not list(tmp_path.iterdir())
+
+
+def test_legacy_store_with_inline_embeddings_loads(tmp_path):
+    with open(tmp_path / "mutual_funds.json", "w") as f:
+        json.dump({
+            "embeddings": [[1.0, 0.0], [0.0, 1.0]],
+            "chunks": ["a", "b"],
+            "metadatas": [{"fund_name": "A"}, {"fund_name": "B"}],
+        }, f)
+
+    loaded = SimpleVectorStore(db_path=str(tmp_path))
+    assert loaded.chunks == ["a", "b"]
+    assert [chunk["text"] for chunk in loaded.search([0.0, 1.0], top_k=1)] == ["b"]
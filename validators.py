@@ -5,6 +5,10 @@ Data validation functions for extracted mutual fund data
 import re
 from typing import Dict, List, Tuple
 
+# Patterns used by the validators, compiled once at import
+_PERCENTAGE_RE = re.compile(r'([0-9.]+)%')
+_YEARS_RE = re.compile(r'(\d+)\s*(Y|YR|YRS|YEAR|YEARS)', re.IGNORECASE)
+
 
 def validate_expense_ratio(value: str) -> Tuple[bool, str]:
     """
@@ -47,8 +51,7 @@ def validate_exit_load(value: str) -> Tuple[bool, str]:
     # Check if it contains a conditional description (like "Exit load of 0.25%, if redeemed within 30 days")
     if "exit load" in value.lower() and "%" in value:
         # Extract percentage from the description
-        import re
-        percentage_match = re.search(r'([0-9.]+)%', value)
+        percentage_match = _PERCENTAGE_RE.search(value)
         if percentage_match:
             try:
                 num_value = float(percentage_match.group(1))
@@ -113,8 +116,7 @@ def validate_lock_in(value: str) -> Tuple[bool, str]:
         return True, ""
     
     # Check for year format: 3Y, 3YRS, 3 YEARS, etc.
-    year_pattern = re.compile(r'(\d+)\s*(Y|YR|YRS|YEAR|YEARS)', re.IGNORECASE)
-    match = year_pattern.search(value)
+    match = _YEARS_RE.search(value)
     if match:
         years = int(match.group(1))
         if 0 <= years <= 20:  # Reasonable range
@@ -7,6 +7,8 @@ import os
 from typing import List, Dict, Optional
 import logging
 
+import numpy as np
+
 try:
     import chromadb
     from chromadb.config import Settings
@@ -63,7 +65,7 @@ class VectorStore:
         # Add to collection
         self.collection.add(
             ids=ids,
-            embeddings=embeddings,
+            embeddings=np.asarray(embeddings, dtype=np.float32).tolist(),
             documents=texts,
             metadatas=metadatas
         )
@@ -82,7 +84,7 @@ class VectorStore:
             List of dictionaries with 'text', 'metadata', and 'distance'
         """
         results = self.collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=[np.asarray(query_embedding, dtype=np.float32).tolist()],
             n_results=top_k
         )
         
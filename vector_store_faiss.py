@@ -0,0 +1,167 @@
+"""
+FAISS-backed variant of the simple vector store
+Chunks, metadata and the JSON file are handled by SimpleVectorStore; retrieval goes
+through a FAISS inner-product index persisted next to the JSON file
+"""
+
+import os
+import numpy as np
+from typing import List
+import logging
+
+from vector_store_simple import SimpleVectorStore
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# HNSW graph parameters (neighbours per node, build-time and query-time beam widths)
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+# IVF-PQ parameters (PQ sub-quantizers, bits per code, inverted lists probed per query)
+PQ_M = 8
+PQ_NBITS = 8
+IVF_NPROBE = 8
+
+
+class FaissVectorStore(SimpleVectorStore):
+    """Vector store searching normalized embeddings with faiss.IndexFlatIP (or HNSW / IVF-PQ)"""
+
+    def __init__(self, db_path: str = "data/vector_db", collection_name: str = "mutual_funds",
+                 ann_backend: str = "flat", ann_min_vectors: int = 5000, load_existing: bool = True):
+        """
+        Args:
+            db_path: Directory of the persisted JSON and index files
+            collection_name: Name of the collection (file names)
+            ann_backend: "flat" (exact scan), "hnsw" (approximate graph search) or "ivfpq"
+                         (inverted lists of product-quantized codes, 8 bytes per vector);
+                         approximate indexes are used once the collection holds more
+                         than ann_min_vectors vectors
+            ann_min_vectors: Collection size above which the approximate index is built
+            load_existing: Load the persisted collection and index (False starts empty)
+        """
+        if not FAISS_AVAILABLE:
+            raise ImportError("FAISS library required. Install with: pip install faiss-cpu")
+        if ann_backend not in ("flat", "hnsw", "ivfpq"):
+            raise ValueError(f"Unsupported ANN backend: {ann_backend}")
+        self.ann_backend = ann_backend
+        self.ann_min_vectors = ann_min_vectors
+        # Built from self.embeddings on first search unless loaded from disk
+        self.index = None
+        super().__init__(db_path, collection_name, load_existing=load_existing)
+
+    def _get_index_path(self) -> str:
+        """Get path to the persisted FAISS index"""
+        return os.path.join(self.db_path, f"{self.collection_name}.faiss")
+
+    def _load_from_json(self):
+        """Load chunks from JSON, and the FAISS index if it matches them"""
+        super()._load_from_json()
+        index_path = self._get_index_path()
+        if len(self.embeddings) and os.path.exists(index_path):
+            try:
+                index = self._read_index(index_path)
+                matches = index.ntotal == len(self.embeddings) and index.d == self.embeddings.shape[1]
+                if matches and self._index_kind(index) == self._wanted_kind(index.ntotal):
+                    self._set_search_params(index)
+                    self.index = index
+                else:
+                    logger.info(f"Stale FAISS index at {index_path}, rebuilding")
+            except Exception as e:
+                logger.warning(f"Failed to load FAISS index from {index_path}: {e}")
+
+    @staticmethod
+    def _read_index(index_path: str):
+        """Read the index memory-mapped where FAISS supports it (inverted lists), else into RAM"""
+        try:
+            return faiss.read_index(index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except Exception:
+            return faiss.read_index(index_path)
+
+    def _save_to_json(self):
+        """Save chunks to JSON and write the rebuilt FAISS index"""
+        super()._save_to_json()
+        index_path = self._get_index_path()
+        try:
+            faiss.write_index(self._get_index(), index_path)
+        except Exception as e:
+            logger.error(f"Failed to save FAISS index to {index_path}: {e}")
+
+    def _set_matrix(self, embeddings: np.ndarray):
+        """Keep the float32 matrix (for persistence) and invalidate the index"""
+        self.embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        self.index = None
+
+    def _wanted_kind(self, count: int) -> str:
+        # Below the threshold a flat scan is as fast and exact
+        return self.ann_backend if count > self.ann_min_vectors else "flat"
+
+    @staticmethod
+    def _index_kind(index) -> str:
+        if isinstance(index, faiss.IndexHNSWFlat):
+            return "hnsw"
+        if isinstance(index, faiss.IndexIVFPQ):
+            return "ivfpq"
+        return "flat"
+
+    @staticmethod
+    def _set_search_params(index):
+        """Query-time settings (not all of them survive write_index/read_index)"""
+        if isinstance(index, faiss.IndexHNSWFlat):
+            index.hnsw.efSearch = HNSW_EF_SEARCH
+        elif isinstance(index, faiss.IndexIVFPQ):
+            index.nprobe = IVF_NPROBE
+
+    def _build_index(self, embeddings: np.ndarray):
+        """Inner-product index (cosine similarity on unit-norm rows)"""
+        count, dim = embeddings.shape
+        kind = self._wanted_kind(count)
+        if kind == "hnsw":
+            index = faiss.IndexHNSWFlat(dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        elif kind == "ivfpq":
+            # PQ_M bytes per vector instead of 4 * dim; the codebooks are trained on the data
+            nlist = min(256, max(8, int(4 * np.sqrt(count))))
+            quantizer = faiss.IndexFlatIP(dim)
+            index = faiss.IndexIVFPQ(quantizer, dim, nlist, PQ_M, PQ_NBITS, faiss.METRIC_INNER_PRODUCT)
+            index.train(embeddings)
+        else:
+            index = faiss.IndexFlatIP(dim)
+        self._set_search_params(index)
+        index.add(embeddings)
+        return index
+
+    def _get_index(self):
+        if self.index is None:
+            self.index = self._build_index(self.embeddings)
+        return self.index
+
+    def search_ids(self, query_embedding: List[float], top_k: int = 3):
+        """
+        Row ids and cosine similarities of the top_k chunks, best first.
+
+        Returns:
+            Tuple of (int64 id array, float32 similarity array)
+        """
+        if len(self.embeddings) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        query_emb = np.asarray(query_embedding, dtype=np.float32).reshape(1, -1)
+        similarities, indices = self._get_index().search(query_emb, min(top_k, len(self.chunks)))
+
+        # FAISS pads with -1 when fewer than top_k results are found
+        found = indices[0] >= 0
+        return indices[0][found], similarities[0][found]
+
+    def clear_collection(self):
+        """Clear all data from collection, including the FAISS index file"""
+        super().clear_collection()
+        self.index = None
+        index_path = self._get_index_path()
+        if os.path.exists(index_path):
+            os.remove(index_path)
@@ -4,44 +4,117 @@ Lightweight alternative to ChromaDB for Vercel deployment
 """
 
 import os
+import glob
 import json
 import numpy as np
 from typing import List, Dict, Optional
 import logging
 
+from quantization import dequantize_int8, quantize_int8, to_float16
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False  # Fall back to stdlib json
+
 logger = logging.getLogger(__name__)
 
+# Read buffer for loading the persisted store (1 MiB instead of the 8 KiB default)
+LOAD_BUFFER_SIZE = 1024 * 1024
+# Rows upcast per block when searching float16 embeddings (keeps each block cache-resident)
+FLOAT16_BLOCK_ROWS = 4096
+
 
 class SimpleVectorStore:
     """Lightweight in-memory vector database using numpy"""
     
-    def __init__(self, db_path: str = "data/vector_db", collection_name: str = "mutual_funds"):
+    def __init__(self, db_path: str = "data/vector_db", collection_name: str = "mutual_funds",
+                 precision: str = "float32", load_existing: bool = True):
+        """
+        Args:
+            db_path: Directory of the persisted JSON file
+            collection_name: Name of the collection (JSON file name)
+            precision: In-memory embedding format: "float32", "float16" (2x smaller) or
+                       "int8" (4x smaller, one float32 scale per row); the JSON file
+                       always holds float32 values
+            load_existing: Load the persisted collection (False starts empty, e.g. for
+                           a rebuild that replaces the files)
+        """
+        if precision not in ("float32", "float16", "int8"):
+            raise ValueError(f"Unsupported precision: {precision}")
         self.db_path = db_path
         self.collection_name = collection_name
+        self.precision = precision
         
-        # In-memory storage
-        self.embeddings: List[np.ndarray] = []
-        self.chunks: List[Dict] = []
+        # In-memory storage - one contiguous (N, D) matrix of normalized embeddings
+        # (float32, float16, or int8 with per-row scales in self.scales)
+        self.embeddings: np.ndarray = np.empty((0, 0), dtype=np.float32)
+        self.scales: Optional[np.ndarray] = None
+        self.chunks: List[str] = []
         self.metadatas: List[Dict] = []
+        # Per-chunk fields the pipeline reads on every query, parallel to self.chunks
+        # (indexed by the ids returned from search_ids)
+        self.fund_names_lower: List[str] = []
+        self.source_urls: List[str] = []
         
         # Load from JSON if exists
-        self._load_from_json()
+        if load_existing:
+            self._load_from_json()
     
     def _get_json_path(self) -> str:
         """Get path to JSON file for persistence"""
-        os.makedirs(self.db_path, exist_ok=True)
         return os.path.join(self.db_path, f"{self.collection_name}.json")
     
+    def _get_matrix_path(self, build_id: str) -> str:
+        """Get path to the .npy embedding matrix written by one save (memory-mapped on load)"""
+        return os.path.join(self.db_path, f"{self.collection_name}.{build_id}.npy")
+    
+    def _matrix_paths(self) -> List[str]:
+        """All .npy matrix files of this collection (including ones from earlier saves)"""
+        return glob.glob(os.path.join(glob.escape(self.db_path), f"{glob.escape(self.collection_name)}.*.npy"))
+    
+    def _load_matrix(self, info: Dict) -> Optional[np.ndarray]:
+        """
+        Memory-map the .npy matrix the JSON was saved with (each save writes a new file
+        named by its build id), if it has the recorded size, shape and dtype
+        """
+        matrix_path = self._get_matrix_path(info.get('build_id', ''))
+        try:
+            if os.path.getsize(matrix_path) != info.get('size'):
+                return None
+            # Pages are read from the file on first touch (and shared between processes)
+            matrix = np.load(matrix_path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        if matrix.shape != (info.get('rows'), info.get('dim')) or matrix.dtype != np.float32:
+            return None
+        return matrix
+    
     def _load_from_json(self):
-        """Load embeddings and chunks from JSON file"""
+        """Load chunks from the JSON file and the embeddings from the .npy matrix next to it"""
         json_path = self._get_json_path()
         if os.path.exists(json_path):
             try:
-                with open(json_path, 'r') as f:
-                    data = json.load(f)
-                    self.embeddings = [np.array(emb) for emb in data.get('embeddings', [])]
-                    self.chunks = data.get('chunks', [])
-                    self.metadatas = data.get('metadatas', [])
+                # Single buffered read of the whole file - this runs on every cold start
+                with open(json_path, 'rb', buffering=LOAD_BUFFER_SIZE) as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                if 'matrix' in data:
+                    embeddings = self._load_matrix(data['matrix'])
+                    if embeddings is None:
+                        logger.warning(f"Embedding matrix of {json_path} is missing or doesn't match it "
+                                       f"- rebuild the index")
+                        return
+                else:
+                    # Stores saved before the .npy matrix: embeddings inline in the JSON.
+                    # Convert all rows in one C-level pass (float32, same as add_chunks)
+                    embeddings = np.asarray(data.get('embeddings', []), dtype=np.float32)
+                if embeddings.size:
+                    self._set_matrix(embeddings)
+                self.chunks = data.get('chunks', [])
+                self.metadatas = data.get('metadatas', [])
+                self._index_metadata(self.metadatas)
                 logger.info(f"Loaded {len(self.chunks)} chunks from {json_path}")
             except Exception as e:
                 logger.warning(f"Failed to load from {json_path}: {e}")
@@ -49,20 +122,74 @@ class SimpleVectorStore:
             logger.info(f"No existing data found at {json_path}")
     
     def _save_to_json(self):
-        """Save embeddings and chunks to JSON file"""
+        """Save the embedding matrix to a new .npy file, then chunks and the matrix's build id to JSON"""
         json_path = self._get_json_path()
         try:
+            # Only writes need the directory; loading works from a read-only bundle
+            os.makedirs(self.db_path, exist_ok=True)
+            matrix = np.ascontiguousarray(self._float_matrix(), dtype=np.float32)
+            if matrix.size == 0:
+                matrix = np.empty((0, 0), dtype=np.float32)
+            # A new file per save (never overwritten in place): other processes may have
+            # the previous one mapped, and the JSON names exactly the file it belongs to
+            build_id = os.urandom(8).hex()
+            matrix_path = self._get_matrix_path(build_id)
+            with open(f"{matrix_path}.tmp", 'wb') as f:
+                np.save(f, matrix)
+            os.replace(f"{matrix_path}.tmp", matrix_path)
             data = {
-                'embeddings': [emb.tolist() for emb in self.embeddings],
+                'matrix': {
+                    'build_id': build_id,
+                    'rows': matrix.shape[0],
+                    'dim': matrix.shape[1],
+                    'size': os.path.getsize(matrix_path)
+                },
                 'chunks': self.chunks,
                 'metadatas': self.metadatas
             }
-            with open(json_path, 'w') as f:
-                json.dump(data, f)
+            if ORJSON_AVAILABLE:
+                with open(f"{json_path}.tmp", 'wb') as f:
+                    f.write(orjson.dumps(data))
+            else:
+                with open(f"{json_path}.tmp", 'w') as f:
+                    json.dump(data, f)
+            os.replace(f"{json_path}.tmp", json_path)
+            self._remove_matrix_files(keep=matrix_path)
             logger.info(f"Saved {len(self.chunks)} chunks to {json_path}")
         except Exception as e:
             logger.error(f"Failed to save to {json_path}: {e}")
     
+    def _remove_matrix_files(self, keep: Optional[str] = None):
+        """Delete earlier saves' matrix files (processes still mapping one keep their pages)"""
+        for path in self._matrix_paths():
+            if path != keep:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warning(f"Failed to remove {path}: {e}")
+    
+    def _index_metadata(self, metadatas: List[Dict]):
+        """Append the per-chunk lookup fields of new metadata entries"""
+        self.fund_names_lower.extend(meta.get('fund_name', '').lower() for meta in metadatas)
+        self.source_urls.extend(meta.get('source_url', '') for meta in metadatas)
+    
+    def _set_matrix(self, embeddings: np.ndarray):
+        """Store normalized float32 embeddings in the configured precision"""
+        if self.precision == "int8":
+            self.embeddings, self.scales = quantize_int8(embeddings)
+        elif self.precision == "float16":
+            self.embeddings = to_float16(embeddings)
+        else:
+            self.embeddings = embeddings
+    
+    def _float_matrix(self) -> np.ndarray:
+        """Embeddings as float32 (dequantized in int8 mode)"""
+        if self.scales is not None:
+            return dequantize_int8(self.embeddings, self.scales)
+        if self.embeddings.dtype == np.float16:
+            return self.embeddings.astype(np.float32)
+        return self.embeddings
+    
     def add_chunks(self, chunks: List[Dict], embeddings: List[List[float]]):
         """
         Add chunks with embeddings to the vector store.
@@ -74,19 +201,21 @@ class SimpleVectorStore:
         if len(chunks) != len(embeddings):
             raise ValueError(f"Mismatch: {len(chunks)} chunks but {len(embeddings)} embeddings")
         
-        # Convert to numpy arrays and normalize
-        for emb in embeddings:
-            emb_array = np.array(emb, dtype=np.float32)
-            # Normalize for cosine similarity
-            norm = np.linalg.norm(emb_array)
-            if norm > 0:
-                emb_array = emb_array / norm
-            self.embeddings.append(emb_array)
+        # Convert to one float32 matrix and normalize all rows at once (for cosine similarity)
+        if chunks:
+            new_matrix = np.array(embeddings, dtype=np.float32)
+            norms = np.linalg.norm(new_matrix, axis=1, keepdims=True)
+            np.divide(new_matrix, norms, out=new_matrix, where=norms > 0)
+            if len(self.embeddings) == 0:
+                self._set_matrix(new_matrix)
+            else:
+                self._set_matrix(np.vstack([self._float_matrix(), new_matrix]))
         
         # Store chunks and metadatas
-        for chunk in chunks:
-            self.chunks.append(chunk.get('text', ''))
-            self.metadatas.append(chunk.get('metadata', {}))
+        new_metadatas = [chunk.get('metadata', {}) for chunk in chunks]
+        self.chunks.extend(chunk.get('text', '') for chunk in chunks)
+        self.metadatas.extend(new_metadatas)
+        self._index_metadata(new_metadatas)
         
         # Save to JSON
         self._save_to_json()
@@ -99,37 +228,63 @@ class SimpleVectorStore:
         Uses cosine similarity.
         
         Args:
-            query_embedding: Embedding vector of the query
+            query_embedding: Unit-norm embedding vector of the query
             top_k: Number of results to return
             
         Returns:
-            List of dictionaries with 'text', 'metadata', and 'distance'
+            List of dictionaries with 'id' (row in the parallel lists), 'text',
+            'metadata', 'fund_name_lower', 'source_url', and 'distance'
         """
-        if len(self.embeddings) == 0:
-            return []
+        ids, similarities = self.search_ids(query_embedding, top_k)
+        return [
+            {
+                "id": idx,
+                "text": self.chunks[idx],
+                "metadata": self.metadatas[idx],
+                "fund_name_lower": self.fund_names_lower[idx],
+                "source_url": self.source_urls[idx],
+                "distance": 1 - similarity  # Convert similarity to distance
+            }
+            for idx, similarity in zip(ids.tolist(), similarities.tolist())
+        ]
+    
+    def search_ids(self, query_embedding: List[float], top_k: int = 3):
+        """
+        Row ids and cosine similarities of the top_k chunks, best first.
         
-        # Convert query to numpy array and normalize
-        query_emb = np.array(query_embedding, dtype=np.float32)
-        norm = np.linalg.norm(query_emb)
-        if norm > 0:
-            query_emb = query_emb / norm
+        Returns:
+            Tuple of (int64 id array, float32 similarity array)
+        """
+        if len(self.embeddings) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
         
-        # Compute cosine similarities (dot product of normalized vectors)
-        similarities = np.array([np.dot(query_emb, emb) for emb in self.embeddings])
+        # Both embedders return unit-norm vectors, so no query normalization is needed
+        query_emb = np.asarray(query_embedding, dtype=np.float32)
         
-        # Get top_k indices
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        # Compute cosine similarities (dot product of normalized vectors) in one matrix-vector product
+        if self.scales is not None:
+            # int8 x int8 dot products accumulated in int32, then rescaled per row
+            query_q, query_scale = quantize_int8(query_emb)
+            raw = self.embeddings.astype(np.int32) @ query_q[0].astype(np.int32)
+            similarities = raw * self.scales * query_scale[0]
+        elif self.embeddings.dtype == np.float16:
+            # numpy has no BLAS path for float16 products - upcast block by block instead
+            similarities = np.empty(len(self.embeddings), dtype=np.float32)
+            for start in range(0, len(self.embeddings), FLOAT16_BLOCK_ROWS):
+                block = self.embeddings[start:start + FLOAT16_BLOCK_ROWS]
+                similarities[start:start + len(block)] = block.astype(np.float32) @ query_emb
+        else:
+            similarities = self.embeddings @ query_emb
         
-        # Format results
-        retrieved_chunks = []
-        for idx in top_indices:
-            retrieved_chunks.append({
-                "text": self.chunks[idx],
-                "metadata": self.metadatas[idx],
-                "distance": 1 - similarities[idx]  # Convert similarity to distance
-            })
+        # Get top_k indices: partial selection (O(N)), then sort only those k
+        top_k = min(top_k, len(similarities))
+        if top_k < len(similarities):
+            top_indices = np.argpartition(-similarities, top_k - 1)[:top_k]
+        else:
+            top_indices = np.arange(len(similarities))
+        top_indices = top_indices[np.argsort(-similarities[top_indices], kind="stable")]
         
-        return retrieved_chunks
+        return top_indices, similarities[top_indices].astype(np.float32)
     
     def get_collection_count(self) -> int:
         """Get number of chunks in collection"""
@@ -137,14 +292,17 @@ class SimpleVectorStore:
     
     def clear_collection(self):
         """Clear all data from collection"""
-        self.embeddings = []
+        self.embeddings = np.empty((0, 0), dtype=np.float32)
+        self.scales = None
         self.chunks = []
         self.metadatas = []
+        self.fund_names_lower = []
+        self.source_urls = []
         
-        # Delete JSON file
-        json_path = self._get_json_path()
-        if os.path.exists(json_path):
-            os.remove(json_path)
+        # Delete JSON file and matrix files
+        if os.path.exists(self._get_json_path()):
+            os.remove(self._get_json_path())
+        self._remove_matrix_files()
         
         logger.info("Collection cleared")
 